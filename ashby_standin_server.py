@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Ashby Stand-in Server - local, fault-injecting copy of the Ashby job board API
+Serves /posting-api/job-board/<board> from fixtures or generated jobs so the
+job monitor can be benchmarked under load without touching the real API
+"""
+
+import json
+import hashlib
+import random
+import re
+import threading
+import time
+import uuid
+import logging
+import argparse
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+BOARD_PATH = re.compile(r'^/posting-api/job-board/([^/]+)/?$')
+
+# (location, region, country, currency) - San Francisco weighted like the real board
+LOCATIONS = [
+    ('San Francisco', 'California', 'United States', 'USD'),
+    ('San Francisco', 'California', 'United States', 'USD'),
+    ('San Francisco', 'California', 'United States', 'USD'),
+    ('New York City', 'New York', 'United States', 'USD'),
+    ('Seattle', 'Washington', 'United States', 'USD'),
+    ('Washington, DC', 'District of Columbia', 'United States', 'USD'),
+    ('Remote - US', None, 'United States', 'USD'),
+    ('London, UK', 'England', 'United Kingdom', 'GBP'),
+    ('Dublin, Ireland', 'Leinster', 'Ireland', 'EUR'),
+    ('Paris, France', 'Ile-de-France', 'France', 'EUR'),
+    ('Tokyo, Japan', 'Tokyo', 'Japan', 'JPY'),
+    ('Singapore', None, 'Singapore', 'SGD'),
+]
+
+DEPARTMENTS = {
+    'Applied AI': ['Applied AI Engineering', 'Solutions Architecture'],
+    'Research': ['Alignment', 'Post-Training', 'Reasoning'],
+    'Go To Market': ['Sales', 'Customer Success', 'Partnerships'],
+    'Security': ['Corporate Security', 'Detection & Response'],
+    'Finance': ['Accounting', 'Strategic Finance'],
+    'People': ['Recruiting', 'People Operations'],
+    'Scaling': ['Supercomputing', 'Inference'],
+    'Legal': ['Legal'],
+}
+
+ROLES = ['Software Engineer', 'Research Engineer', 'Research Scientist', 'Product Manager',
+         'Account Director', 'Data Scientist', 'Program Manager', 'Security Engineer',
+         'Recruiter', 'Financial Analyst', 'Counsel', 'Solutions Engineer']
+LEVELS = ['', 'Senior ', 'Staff ', 'Principal ', 'Lead ']
+
+class JobGenerator:
+    """Generate deterministic, realistically shaped Ashby job postings"""
+    
+    def __init__(self, seed: int = 0, description_size: int = 2000):
+        self.seed = seed
+        self.description_size = description_size
+    
+    def generate_board(self, board: str, count: int) -> List[Dict]:
+        rng = random.Random(f"{self.seed}:{board}")
+        return [self.generate_job(rng, board) for _ in range(count)]
+    
+    def generate_job(self, rng: random.Random, board: str) -> Dict:
+        job_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        department = rng.choice(list(DEPARTMENTS))
+        location, region, country, currency = rng.choice(LOCATIONS)
+        secondary = [loc for loc in rng.sample(LOCATIONS, rng.choice([0, 0, 0, 1, 2])) if loc[0] != location]
+        published = datetime(2025, 1, 1) + timedelta(minutes=rng.randrange(0, 60 * 24 * 240))
+        job_url = f"https://jobs.ashbyhq.com/{board}/{job_id}"
+        
+        return {
+            'id': job_id,
+            'title': f"{rng.choice(LEVELS)}{rng.choice(ROLES)}, {department}",
+            'department': department,
+            'team': rng.choice(DEPARTMENTS[department]),
+            'employmentType': rng.choice(['FullTime'] * 9 + ['Contract']),
+            'location': location,
+            'shouldDisplayCompensationOnJobPostings': True,
+            'secondaryLocations': [{'location': loc[0], 'address': self.address(*loc[:3])} for loc in secondary],
+            'publishedAt': published.isoformat(timespec='milliseconds') + '+00:00',
+            'isListed': True,
+            'isRemote': True if location.startswith('Remote') else None,
+            'address': self.address(location, region, country),
+            'jobUrl': job_url,
+            'applyUrl': f"{job_url}/application",
+            'descriptionHtml': self.description(rng, html=True),
+            'descriptionPlain': self.description(rng, html=False),
+            'compensation': self.compensation(rng, currency),
+        }
+    
+    def address(self, location: str, region: Optional[str], country: str) -> Dict:
+        postal_address = {'addressCountry': country, 'addressLocality': location.split(',')[0]}
+        if region:
+            postal_address['addressRegion'] = region
+        return {'postalAddress': postal_address}
+    
+    def description(self, rng: random.Random, html: bool) -> str:
+        words = ['mission', 'research', 'deploy', 'safety', 'customers', 'models', 'scale',
+                 'build', 'team', 'impact', 'systems', 'product', 'collaborate', 'ship']
+        text = []
+        size = 0
+        while size < self.description_size:
+            sentence = ' '.join(rng.choice(words) for _ in range(12)).capitalize() + '.'
+            text.append(f"<p>{sentence}</p>" if html else sentence)
+            size += len(sentence) + 1
+        return ''.join(text) if html else '\n'.join(text)
+    
+    def compensation(self, rng: random.Random, currency: str) -> Dict:
+        if rng.random() < 0.05:
+            return {}
+        
+        hourly = rng.random() < 0.03
+        if hourly:
+            salary_min = rng.randrange(40, 90)
+            salary_max = salary_min + rng.randrange(5, 40)
+            interval, summary = '1 HOUR', f"{salary_min} – {salary_max} {currency}/hr"
+        else:
+            salary_min = rng.randrange(120, 400) * 1000
+            salary_max = salary_min + rng.randrange(20, 150) * 1000
+            interval, summary = '1 YEAR', f"{salary_min // 1000}K – {salary_max // 1000}K {currency}"
+        
+        components = [{'compensationType': 'Salary', 'interval': interval, 'currencyCode': currency,
+                       'minValue': salary_min, 'maxValue': salary_max}]
+        extras = []
+        if rng.random() < 0.9:
+            components.append({'compensationType': 'EquityCashValue', 'interval': '1 YEAR',
+                               'currencyCode': currency, 'minValue': None, 'maxValue': None})
+            extras.append('Offers Equity')
+        if rng.random() < 0.1:
+            components.append({'compensationType': 'Bonus', 'interval': '1 YEAR',
+                               'currencyCode': currency, 'minValue': None, 'maxValue': None})
+            extras.append('Offers Bonus')
+        
+        tier_summary = ' • '.join([summary] + extras)
+        return {
+            'compensationTierSummary': tier_summary,
+            'scrapeableCompensationSalarySummary': summary.replace('–', '-'),
+            'compensationTiers': [{'tierSummary': tier_summary, 'title': None, 'components': components}],
+            'summaryComponents': components,
+        }
+
+class AshbyStandinServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the board payloads and fault injection settings"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, settings: Dict):
+        super().__init__(address, AshbyStandinHandler)
+        self.settings = settings
+        self.generator = JobGenerator(settings.get('seed', 0), settings.get('description_size', 2000))
+        self.rng = random.Random(settings.get('seed', 0))
+        self.lock = threading.Lock()
+        self.payloads = {}
+        self.stats = {'requests': 0, 'not_modified': 0, 'errors': 0, 'truncated': 0, 'dripped': 0}
+        self.fixture_jobs = None
+        if settings.get('fixture'):
+            with open(settings['fixture'], 'r') as f:
+                data = json.load(f)
+            self.fixture_jobs = data['jobs'] if isinstance(data, dict) else data
+    
+    def payload(self, board: str) -> Dict:
+        """Build (once) and return the encoded body and validators for a board"""
+        with self.lock:
+            if board not in self.payloads:
+                size = self.settings.get('board_sizes', {}).get(board, self.settings.get('jobs', 250))
+                if self.fixture_jobs is not None and board not in self.settings.get('board_sizes', {}):
+                    jobs = self.fixture_jobs
+                else:
+                    jobs = self.generator.generate_board(board, size)
+                body = json.dumps({'apiVersion': '1', 'jobs': jobs}).encode('utf-8')
+                self.payloads[board] = {
+                    'body': body,
+                    'etag': f'"{hashlib.sha1(body).hexdigest()}"',
+                    'last_modified': formatdate(time.time(), usegmt=True),
+                }
+                logger.info(f"Prepared board '{board}' with {len(jobs)} jobs ({len(body) / 1e6:.1f} MB)")
+            return self.payloads[board]
+    
+    def next_fault(self, board: str) -> Optional[str]:
+        """Take the next scripted fault ('error' or 'truncate') queued for a board, if any"""
+        with self.lock:
+            faults = self.settings.get('faults', {}).get(board)
+            return faults.pop(0) if faults else None
+    
+    def roll(self, setting: str) -> bool:
+        """Randomly decide whether to inject the fault controlled by a rate setting"""
+        rate = self.settings.get(setting, 0)
+        with self.lock:
+            return rate > 0 and self.rng.random() < rate
+    
+    def count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+
+class AshbyStandinHandler(BaseHTTPRequestHandler):
+    """Request handler serving the Ashby job board shape with injected faults"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+    
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/stats':
+            self.send_body(200, json.dumps(self.server.stats).encode('utf-8'))
+            return
+        
+        match = BOARD_PATH.match(path)
+        if not match:
+            self.send_body(404, b'{"error": "not found"}')
+            return
+        
+        settings = self.server.settings
+        self.server.count('requests')
+        
+        latency = settings.get('latency', 0) + self.server.rng.uniform(0, settings.get('latency_jitter', 0))
+        if latency:
+            time.sleep(latency)
+        
+        # A scripted fault replaces the random rolls for that request
+        fault = self.server.next_fault(match.group(1))
+        if fault == 'error' or (fault is None and self.server.roll('error_rate')):
+            self.server.count('errors')
+            headers = {'Retry-After': str(settings['retry_after'])} if settings.get('retry_after') else {}
+            self.send_body(self.server.rng.choice([500, 502, 503]), b'{"error": "injected"}', headers)
+            return
+        
+        payload = self.server.payload(match.group(1))
+        if settings.get('validators', True):
+            # As in HTTP, If-Modified-Since only counts when no If-None-Match was sent
+            if_none_match = self.headers.get('If-None-Match')
+            if (if_none_match == payload['etag'] if if_none_match is not None
+                    else self.headers.get('If-Modified-Since') == payload['last_modified']):
+                self.server.count('not_modified')
+                self.send_response(304)
+                self.send_header('ETag', payload['etag'])
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        
+        body = payload['body']
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if settings.get('validators', True):
+            self.send_header('ETag', payload['etag'])
+            self.send_header('Last-Modified', payload['last_modified'])
+        self.end_headers()
+        
+        if fault == 'truncate' or (fault is None and self.server.roll('truncate_rate')):
+            # Promise the full length but hang up part way through
+            self.server.count('truncated')
+            self.wfile.write(body[:self.server.rng.randrange(0, len(body))])
+            self.close_connection = True
+            return
+        
+        if fault is None and self.server.roll('drip_rate'):
+            self.server.count('dripped')
+            self.drip(body, settings.get('drip_bytes_per_sec', 64 * 1024))
+            return
+        
+        self.wfile.write(body)
+    
+    def drip(self, body: bytes, bytes_per_sec: int):
+        """Send the body slowly in small pieces"""
+        piece = max(1, bytes_per_sec // 10)
+        for start in range(0, len(body), piece):
+            self.wfile.write(body[start:start + piece])
+            self.wfile.flush()
+            time.sleep(0.1)
+    
+    def send_body(self, status: int, body: bytes, headers: Optional[Dict] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+def parse_board_sizes(values: List[str]) -> Dict[str, int]:
+    """Parse repeated NAME=COUNT arguments"""
+    board_sizes = {}
+    for value in values:
+        board, _, count = value.partition('=')
+        board_sizes[board] = int(count)
+    return board_sizes
+
+def parse_faults(values: List[str]) -> Dict[str, List[str]]:
+    """Parse repeated BOARD=FAULT[,FAULT...] arguments"""
+    faults = {}
+    for value in values:
+        board, _, sequence = value.partition('=')
+        faults.setdefault(board, []).extend(fault for fault in sequence.split(',') if fault)
+    return faults
+
+def main():
+    parser = argparse.ArgumentParser(description='Local fault-injecting Ashby job board API')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--fixture', help='Serve jobs from a JSON file (a job list or {"jobs": [...]})')
+    parser.add_argument('--jobs', type=int, default=250, help='Jobs per generated board')
+    parser.add_argument('--board-size', action='append', default=[], metavar='BOARD=COUNT',
+                        help='Generate COUNT jobs for BOARD (repeatable, overrides --fixture for that board)')
+    parser.add_argument('--description-size', type=int, default=2000, help='Approximate characters per generated description')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for generated data and faults')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before answering')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with a 5xx')
+    parser.add_argument('--truncate-rate', type=float, default=0.0, help='Fraction of bodies cut off part way through')
+    parser.add_argument('--drip-rate', type=float, default=0.0, help='Fraction of bodies sent slowly')
+    parser.add_argument('--drip-bytes-per-sec', type=int, default=64 * 1024, help='Speed of slow-drip bodies')
+    parser.add_argument('--retry-after', type=int, default=0, help='Retry-After seconds sent with injected 5xx responses')
+    parser.add_argument('--fault', action='append', default=[], metavar='BOARD=FAULT[,FAULT...]',
+                        help='Answer the next requests for BOARD with these faults (error or truncate) in order, '
+                             'before any random ones (repeatable)')
+    parser.add_argument('--no-validators', action='store_true', help='Do not send ETag/Last-Modified or answer 304')
+    
+    args = parser.parse_args()
+    
+    settings = {
+        'fixture': args.fixture,
+        'jobs': args.jobs,
+        'board_sizes': parse_board_sizes(args.board_size),
+        'description_size': args.description_size,
+        'seed': args.seed,
+        'latency': args.latency,
+        'latency_jitter': args.latency_jitter,
+        'error_rate': args.error_rate,
+        'truncate_rate': args.truncate_rate,
+        'drip_rate': args.drip_rate,
+        'drip_bytes_per_sec': args.drip_bytes_per_sec,
+        'retry_after': args.retry_after,
+        'faults': parse_faults(args.fault),
+        'validators': not args.no_validators,
+    }
+    
+    server = AshbyStandinServer((args.host, args.port), settings)
+    
+    # Build the explicitly sized boards up front so generation time isn't measured as latency
+    for board in settings['board_sizes']:
+        server.payload(board)
+    
+    logger.info(f"Ashby stand-in listening on http://{args.host}:{args.port}/posting-api/job-board/<board>")
+    logger.info(f"Point the monitor at it with \"api_url\": "
+                f"\"http://{args.host}:{args.port}/posting-api/job-board/{{board}}?includeCompensation=true\"")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f"Stopping, stats: {server.stats}")
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
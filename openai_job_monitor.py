@@ -6,17 +6,32 @@ Monitors OpenAI jobs via Ashby API and tracks job status over time
 
 import requests
 import json
+import hashlib
+import gzip
+import shutil
 import csv
+import sys
+import difflib
+import sqlite3
+import statistics
+import struct
+import uuid
+import unicodedata
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import schedule
 import time
 import logging
+import random
+import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import argparse
+import codecs
 
 # Configure logging
 logging.basicConfig(
@@ -29,223 +44,2417 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class JsonArrayStream:
+    """Incrementally decode the items of one array member of a top-level JSON object
+    
+    Items are yielded as soon as they are complete, so only the item being
+    decoded is held in memory. Other top-level members are decoded and
+    discarded.
+    """
+    
+    _decoder = json.JSONDecoder()
+    _delimiters = (' ', '\t', '\n', '\r', ',', ']', '}')
+    
+    def __init__(self, chunks: Iterable[bytes], array_key: str):
+        self.chunks = iter(chunks)
+        self.array_key = array_key
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.exhausted = False
+    
+    def _read_more(self) -> bool:
+        """Append the next chunk to the buffer, returning False at end of stream"""
+        if self.exhausted:
+            return False
+        
+        # Drop already consumed text before growing the buffer
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.exhausted = True
+            self.buffer += self.text_decoder.decode(b'', final=True)
+            return False
+        
+        self.buffer += self.text_decoder.decode(chunk)
+        return True
+    
+    def _peek(self) -> str:
+        """Skip whitespace and return the next significant character without consuming it"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                raise json.JSONDecodeError("Unexpected end of stream", self.buffer, self.pos)
+    
+    def _expect(self, allowed: str) -> str:
+        char = self._peek()
+        if char not in allowed:
+            raise json.JSONDecodeError(f"Expected one of {allowed!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+    
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            
+            # A number split across chunks ("2." or "-3e") decodes as a shorter prefix,
+            # so only accept one that is followed by a delimiter
+            if (self.buffer[self.pos] in '-0123456789'
+                    and self.buffer[end:end + 1] not in self._delimiters
+                    and self._read_more()):
+                continue
+            
+            self.pos = end
+            return value
+    
+    def __iter__(self) -> Iterator[Any]:
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key == self.array_key:
+                self._expect('[')
+                if self._peek() == ']':
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self._decode_value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self._decode_value()
+            
+            if self._expect(',}') == '}':
+                return
+
+class LocationMatcher:
+    """Match jobs against a set of target location keywords
+    
+    The keywords are compiled once into a single case-insensitive regex that
+    only matches whole words, so ``sf`` does not match inside unrelated
+    words. Results are memoized per distinct location string, which keeps
+    filtering cheap when many jobs share the same few locations.
+    """
+    
+    def __init__(self, keywords: List[str], include_remote: bool = False):
+        alternatives = '|'.join(re.escape(keyword.strip()) for keyword in
+                                sorted(keywords, key=len, reverse=True) if keyword.strip())
+        self.pattern = re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)', re.IGNORECASE) if alternatives else None
+        self.include_remote = include_remote
+        self.cache = {}
+    
+    def matches_location(self, location: Optional[str]) -> bool:
+        try:
+            return self.cache[location]
+        except KeyError:
+            matched = bool(self.pattern and location and self.pattern.search(location))
+            self.cache[location] = matched
+            return matched
+    
+    def __call__(self, job: Dict) -> bool:
+        if self.matches_location(job.get('location')):
+            return True
+        
+        for sec_loc in job.get('secondaryLocations') or []:
+            if self.matches_location(sec_loc.get('location')):
+                return True
+        
+        # Remote jobs could be relevant too
+        return bool(self.include_remote and job.get('isRemote'))
+
+class JobFilter:
+    """Compile the ``job_filter`` config section into a single predicate
+    
+    Every key in the section is one clause and a job must pass all of them.
+    Keys taking a list match if any entry matches:
+    
+        departments / exclude_departments   department names (case-insensitive)
+        teams / exclude_teams               team names (case-insensitive)
+        employment_types                    e.g. ["FullTime", "Contract"]
+        remote                              true for remote jobs only, false to exclude them
+        title_patterns / exclude_title_patterns   regexes searched in the title
+        min_salary                          lowest salary in the band, as a yearly amount in the
+                                            reference currency, must reach this amount
+    
+    Clauses are checked cheapest first and evaluation stops at the first
+    failure, so fields such as compensation are only looked at for jobs that
+    passed everything else. Salaries are annualized through the monitor's
+    SalaryNormalizer; one in a currency without a rate, or with an unknown
+    pay interval, does not reach any floor.
+    """
+    
+    KEYS = ('departments', 'exclude_departments', 'teams', 'exclude_teams', 'employment_types',
+            'remote', 'title_patterns', 'exclude_title_patterns', 'min_salary')
+    
+    def __init__(self, spec: Optional[Dict] = None, location_matcher: Optional[LocationMatcher] = None,
+                 salary_normalizer: Optional['SalaryNormalizer'] = None):
+        spec = spec or {}
+        unknown = set(spec) - set(self.KEYS)
+        if unknown:
+            raise ValueError(f"Unknown job_filter keys: {', '.join(sorted(unknown))}")
+        if spec.get('min_salary') is not None and salary_normalizer is None:
+            raise ValueError("job_filter min_salary needs a SalaryNormalizer to compare salaries")
+        self.salary_normalizer = salary_normalizer
+        
+        self.clauses = []
+        self._add_name_clause('department', spec.get('departments'), keep=True)
+        self._add_name_clause('department', spec.get('exclude_departments'), keep=False)
+        self._add_name_clause('team', spec.get('teams'), keep=True)
+        self._add_name_clause('team', spec.get('exclude_teams'), keep=False)
+        
+        if spec.get('employment_types'):
+            employment_types = frozenset(spec['employment_types'])
+            self.clauses.append(lambda job: job.get('employmentType') in employment_types)
+        
+        if spec.get('remote') is not None:
+            remote = bool(spec['remote'])
+            self.clauses.append(lambda job: bool(job.get('isRemote')) == remote)
+        
+        if location_matcher is not None:
+            self.clauses.append(location_matcher)
+        
+        if spec.get('title_patterns'):
+            title_pattern = self._compile_patterns(spec['title_patterns'])
+            self.clauses.append(lambda job: title_pattern.search(job.get('title') or '') is not None)
+        
+        if spec.get('exclude_title_patterns'):
+            excluded_pattern = self._compile_patterns(spec['exclude_title_patterns'])
+            self.clauses.append(lambda job: excluded_pattern.search(job.get('title') or '') is None)
+        
+        if spec.get('min_salary') is not None:
+            min_salary = spec['min_salary']
+            self.clauses.append(lambda job: (self.salary_floor(job) or 0) >= min_salary)
+    
+    def _add_name_clause(self, field: str, names: Optional[List[str]], keep: bool):
+        if not names:
+            return
+        
+        names = frozenset(name.lower() for name in names)
+        if keep:
+            self.clauses.append(lambda job: (job.get(field) or '').lower() in names)
+        else:
+            self.clauses.append(lambda job: (job.get(field) or '').lower() not in names)
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]):
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    
+    def salary_floor(self, job: Dict) -> Optional[float]:
+        """Lowest salary offered as a yearly amount in the reference currency, None if it cannot be converted"""
+        for component in (job.get('compensation') or {}).get('summaryComponents') or []:
+            if component.get('compensationType') == 'Salary':
+                lowest = component.get('minValue') or component.get('maxValue')
+                factor = self.salary_normalizer.factor(component.get('currencyCode'), component.get('interval'))
+                return None if lowest is None or factor is None else lowest * factor
+        return None
+    
+    def __call__(self, job: Dict) -> bool:
+        for clause in self.clauses:
+            if not clause(job):
+                return False
+        return True
+
+class TextNormalizer:
+    """One-pass cleanup of API text for reports, CSV and email
+
+    Text is NFKC-normalized, so compatibility forms such as non-breaking
+    spaces and full-width digits become their plain equivalents, then typographic
+    dashes and quotes are translated to ASCII through a single ``str.translate``
+    table. With ``strip_non_ascii`` anything still outside ASCII is dropped;
+    otherwise it is kept. Results are cached per distinct input, and ASCII
+    input is returned as is.
+    """
+
+    TRANSLATIONS = str.maketrans({
+        '\u2010': '-', '\u2011': '-', '\u2012': '-',  # hyphens and figure dash
+        '\u2013': '-', '\u2014': '-', '\u2212': '-',  # en dash, em dash, minus sign
+        '\u2018': "'", '\u2019': "'",                 # single quotes
+        '\u201c': '"', '\u201d': '"',                 # double quotes
+    })
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, strip_non_ascii: bool = True):
+        self.strip_non_ascii = strip_non_ascii
+        self.cache: Dict[str, str] = {}
+
+    def __call__(self, text: str) -> str:
+        if not text or text.isascii():
+            return text
+        cleaned = self.cache.get(text)
+        if cleaned is None:
+            if len(self.cache) >= self.CACHE_SIZE:
+                self.cache.clear()
+            cleaned = unicodedata.normalize('NFKC', text).translate(self.TRANSLATIONS)
+            if self.strip_non_ascii:
+                cleaned = cleaned.encode('ascii', 'ignore').decode('ascii')
+            self.cache[text] = cleaned
+        return cleaned
+
+class SalaryNormalizer:
+    """Annualizes salaries into one reference currency so postings can be ranked together
+
+    Exchange rates come from a local JSON table - ``{"base": "USD", "rates":
+    {"EUR": 1.16, ...}}``, the value of one unit of each currency in the
+    base currency - so runs never depend on a rates service. Ashby intervals
+    such as ``1 HOUR`` are converted with fixed periods per year. A batch of
+    salaries is converted with one factor per distinct currency and
+    interval; salaries in a currency without a rate have no annualized
+    value.
+    """
+
+    # Pay periods in a year, assuming 40-hour, 5-day weeks
+    PERIODS_PER_YEAR = {'YEAR': 1, 'MONTH': 12, 'WEEK': 52, 'DAY': 260, 'HOUR': 2080}
+
+    def __init__(self, rates_file: Path, reference_currency: str = 'USD'):
+        self.reference_currency = reference_currency
+        self.rates = {reference_currency: 1}
+        if not rates_file.exists():
+            logger.warning(f"FX rate table {rates_file} not found - only {reference_currency} salaries can be compared")
+            return
+        try:
+            with open(rates_file, 'r') as f:
+                table = json.load(f)
+            rates = dict(table.get('rates', {}), **{table.get('base', 'USD'): 1})
+        except Exception as e:
+            logger.error(f"Failed to load FX rates from {rates_file}: {e}")
+            return
+        if reference_currency in rates:
+            self.rates = rates
+        else:
+            logger.warning(f"FX rate table {rates_file} has no rate for {reference_currency}")
+
+    def factor(self, currency: Optional[str], interval: Optional[str]) -> Optional[float]:
+        """Multiplier from an amount per interval in a currency to a yearly amount in the reference currency"""
+        rate = self.rates.get(currency or 'USD')
+        if rate is None:
+            return None
+        count, _, unit = (interval or '1 YEAR').upper().partition(' ')
+        if not unit:
+            count, unit = '1', count
+        periods = self.PERIODS_PER_YEAR.get(unit.rstrip('S'))
+        if periods is None or not count.isdigit() or int(count) == 0:
+            return None
+        return periods / int(count) * rate / self.rates[self.reference_currency]
+
+    def annualize(self, salaries: List[Tuple]) -> List[Tuple[Optional[float], Optional[float]]]:
+        """Annual (min, max) in the reference currency for each (min, max, currency, interval)"""
+        factors = {(currency, interval): self.factor(currency, interval)
+                   for _, _, currency, interval in salaries}
+        return [(None, None) if factors[currency, interval] is None else
+                (None if low is None else round(low * factors[currency, interval]),
+                 None if high is None else round(high * factors[currency, interval]))
+                for low, high, currency, interval in salaries]
+
+    def converts(self, currency: Optional[str], interval: Optional[str]) -> bool:
+        """Whether a salary is not already a yearly amount in the reference currency"""
+        return (currency or 'USD') != self.reference_currency or (interval or '1 YEAR').upper() != '1 YEAR'
+
+# Days a closed job stays in the master database before it is archived (or dropped if archiving is off)
+CLOSED_RETENTION_DAYS = 5
+
+# Record fields maintained by the monitor rather than the Ashby API
+LIFECYCLE_FIELDS = ('status', 'first_seen', 'last_seen', 'days_since_listed', 'closed_date', 'days_until_deletion')
+
+# API fields whose changes count as an edit to a posting; other fields are only refreshed alongside them
+FINGERPRINT_FIELDS = ('title', 'department', 'team', 'employmentType', 'location', 'secondaryLocations',
+                      'isRemote', 'compensation')
+
+def normalize_field(value: Any) -> Any:
+    """Collapse whitespace in every string of a field, so reformatting alone is not a change"""
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, dict):
+        return {key: normalize_field(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize_field(item) for item in value]
+    return value
+
+def fingerprint_fields(job: Dict) -> Dict:
+    """Normalized fields a job's fingerprint covers, with descriptions reduced to their SHA-256"""
+    fields = {field: normalize_field(job.get(field)) for field in FINGERPRINT_FIELDS}
+    blobs = job.get('description_blobs') or {}
+    fields['description'] = {
+        field: blobs.get(field) or (hashlib.sha256(job[field].encode('utf-8')).hexdigest() if job.get(field) else None)
+        for field in ('descriptionHtml', 'descriptionPlain')
+    }
+    return fields
+
+def job_fingerprint(job: Dict) -> str:
+    encoded = json.dumps(fingerprint_fields(job), sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+# Parsed compensation by payload hash, shared by every stage and profile of a run
+COMPENSATION_CACHE: Dict[str, Dict] = {}
+COMPENSATION_CACHE_SIZE = 4096
+
+# Parse of a job without compensation data
+EMPTY_COMPENSATION = {
+    'display': {
+        'salary_summary': '',
+        'salary_range': '',
+        'salary_min': '',
+        'salary_max': '',
+        'equity': '',
+        'bonus': '',
+        'full_compensation': ''
+    },
+    'bands': (None, None, None, None),
+    'fields': {
+        'salary_min': None,
+        'salary_max': None,
+        'currency': None,
+        'interval': None,
+        'equity_min': None,
+        'equity_max': None,
+        'has_bonus': False
+    }
+}
+
+# Typed compensation fields stored on each record when it opens or its compensation changes
+COMPENSATION_FIELDS = tuple(EMPTY_COMPENSATION['fields'])
+
+def compensation_key(compensation: Dict) -> str:
+    """Hash of a compensation object, independent of key order"""
+    payload = json.dumps(compensation, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def parse_compensation(compensation: Optional[Dict]) -> Dict:
+    """Display fields and numeric bands of a compensation object, parsed once per distinct payload
+
+    The result is shared between callers and must not be modified.
+    """
+    if not compensation:
+        return EMPTY_COMPENSATION
+    key = compensation_key(compensation)
+    parsed = COMPENSATION_CACHE.get(key)
+    if parsed is None:
+        if len(COMPENSATION_CACHE) >= COMPENSATION_CACHE_SIZE:
+            COMPENSATION_CACHE.clear()
+        try:
+            bands = parse_bands(compensation)
+            parsed = {'display': compensation_display(compensation), 'bands': bands,
+                      'fields': compensation_fields(compensation, bands)}
+        except Exception as e:
+            logger.error(f"Failed to parse compensation: {e}")
+            parsed = EMPTY_COMPENSATION
+        COMPENSATION_CACHE[key] = parsed
+    return parsed
+
+def compensation_display(compensation: Dict) -> Dict:
+    """Formatted salary, equity and bonus strings for reports, CSV and the dashboard"""
+    info = dict(EMPTY_COMPENSATION['display'])
+    if not compensation.get('compensationTierSummary'):
+        return info
+
+    # Human-readable summaries straight from the API, cleaned up by each monitor's TextNormalizer
+    info['full_compensation'] = compensation['compensationTierSummary']
+    info['salary_range'] = compensation.get('scrapeableCompensationSalarySummary', '')
+
+    # Parse detailed compensation components for more granular data
+    for component in compensation.get('summaryComponents') or []:
+        comp_type = component.get('compensationType', '')
+        min_val = component.get('minValue')
+        max_val = component.get('maxValue')
+        currency = component.get('currencyCode', 'USD')
+
+        if comp_type == 'Salary':
+            if min_val and max_val:
+                # Salary range
+                info['salary_summary'] = f"${min_val:,.0f} - ${max_val:,.0f} {currency}"
+                info['salary_min'] = str(int(min_val))
+                info['salary_max'] = str(int(max_val))
+            elif min_val and not max_val:
+                # Single salary value - put in both min and max
+                info['salary_summary'] = f"${min_val:,.0f} {currency}"
+                info['salary_min'] = str(int(min_val))
+                info['salary_max'] = str(int(min_val))
+            elif max_val and not min_val:
+                # Only max value (rare case)
+                info['salary_summary'] = f"Up to ${max_val:,.0f} {currency}"
+                info['salary_min'] = str(int(max_val))
+                info['salary_max'] = str(int(max_val))
+        elif comp_type == 'EquityPercentage' and min_val and max_val:
+            info['equity'] = f"{min_val}% - {max_val}%"
+        elif comp_type == 'EquityCashValue':
+            info['equity'] = 'Offered'
+        elif comp_type == 'Bonus':
+            info['bonus'] = 'Yes' if min_val or max_val else 'Offered'
+    return info
+
+def parse_bands(compensation: Dict) -> Tuple:
+    """Salary and equity bounds of a compensation object as (salary_min, salary_max, equity_min, equity_max)"""
+    salary = (None, None)
+    equity = (None, None)
+    for component in compensation.get('summaryComponents') or []:
+        comp_type = component.get('compensationType')
+        min_val = component.get('minValue')
+        max_val = component.get('maxValue')
+        if comp_type == 'Salary':
+            # A single value is both bounds, as in compensation_display
+            salary = (min_val or max_val, max_val or min_val)
+        elif comp_type in ('EquityPercentage', 'EquityCashValue') and equity == (None, None):
+            equity = (min_val, max_val)
+    return salary + equity
+
+def compensation_fields(compensation: Dict, bands: Tuple) -> Dict:
+    """Numeric salary and equity bounds, salary currency and interval, and whether a bonus is offered"""
+    components = compensation.get('summaryComponents') or []
+    salary = next((component for component in components if component.get('compensationType') == 'Salary'), {})
+    return {
+        'salary_min': bands[0],
+        'salary_max': bands[1],
+        'currency': salary.get('currencyCode'),
+        'interval': salary.get('interval'),
+        'equity_min': bands[2],
+        'equity_max': bands[3],
+        'has_bonus': any(component.get('compensationType') == 'Bonus' for component in components)
+    }
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+DAY_US = 86400 * 1000000
+
+# Epoch microseconds by lifecycle timestamp text - every record touched by a run gets the same
+# timestamp, so a handful of distinct values cover the whole database
+TIMESTAMP_CACHE: Dict[str, int] = {}
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Check time the last refresh_lifecycle_fields call used, as (datetime, ISO text, epoch microseconds) -
+# stores refresh every record against the same one
+LAST_REFRESH_CLOCK: Tuple = (None, '', 0)
+
+def to_epoch_us(moment: datetime) -> int:
+    """Exact microseconds since the epoch - naive datetimes are measured from a naive epoch"""
+    delta = moment - (EPOCH_UTC if moment.tzinfo else EPOCH)
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+def from_epoch_us(value: int, aware: bool = False) -> datetime:
+    return (EPOCH_UTC if aware else EPOCH) + timedelta(microseconds=value)
+
+def timestamp_us(timestamp: str) -> int:
+    """Epoch microseconds of a lifecycle timestamp, parsed once per distinct value"""
+    value = TIMESTAMP_CACHE.get(timestamp)
+    if value is None:
+        if len(TIMESTAMP_CACHE) >= TIMESTAMP_CACHE_SIZE:
+            TIMESTAMP_CACHE.clear()
+        value = to_epoch_us(datetime.fromisoformat(timestamp))
+        TIMESTAMP_CACHE[timestamp] = value
+    return value
+
+def refresh_lifecycle_fields(job: Dict, as_of: datetime):
+    """Recompute the lifecycle fields that only move with the clock"""
+    global LAST_REFRESH_CLOCK
+    clock = LAST_REFRESH_CLOCK
+    if clock[0] is not as_of:
+        clock = LAST_REFRESH_CLOCK = (as_of, as_of.isoformat(), to_epoch_us(as_of))
+    _, as_of_text, now = clock
+    first_seen = timestamp_us(job['first_seen'])
+    if job['status'] == 'ACTIVE':
+        job['last_seen'] = as_of_text
+        job['days_since_listed'] = (now - first_seen) // DAY_US
+        job.pop('days_until_deletion', None)  # Left over if the job was reopened
+    else:
+        closed_date = timestamp_us(job['closed_date'])
+        job['days_since_listed'] = (closed_date - first_seen) // DAY_US
+        job['days_until_deletion'] = max(0, CLOSED_RETENTION_DAYS - (now - closed_date) // DAY_US)
+
+def job_key(job: Dict) -> str:
+    """Lifecycle key of a job or event: its Ashby id, or its jobUrl for records saved without one"""
+    return job.get('id') or job['jobUrl']
+
+def apply_job_event(jobs_by_key: Dict[str, Dict], event: Dict):
+    """Apply one OPENED, REMAPPED, UPDATED, CLOSED or PURGED lifecycle event to records keyed by job_key"""
+    key = job_key(event)
+    if event['type'] == 'OPENED':
+        jobs_by_key[key] = dict(event['record'])
+    elif event['type'] == 'REMAPPED':
+        job = jobs_by_key.pop(event['previous_key'], None)
+        if job is not None:
+            job['id'] = event['id']
+            jobs_by_key[key] = job
+    elif event['type'] == 'UPDATED':
+        jobs_by_key[key].update(event['fields'])
+        for field in event.get('removed', ()):
+            jobs_by_key[key].pop(field, None)
+    elif event['type'] == 'CLOSED':
+        jobs_by_key[key]['status'] = 'CLOSED'
+        jobs_by_key[key]['closed_date'] = event['at']
+        jobs_by_key[key]['last_seen'] = event['last_seen']
+    elif event['type'] == 'PURGED':
+        jobs_by_key.pop(key, None)
+
+class JobRecord:
+    """Compact, typed form of a job record, converted losslessly to and from the API/database dict
+
+    Timestamps are held as integer microseconds since the epoch
+    (``publishedAt`` in UTC, the monitor's own lifecycle timestamps as the
+    naive local times they are written in), department and team names are
+    interned, and the typed compensation fields have slots of their own -
+    read from the record, or parsed from its compensation for a record
+    saved without them. Keys without a slot live in ``fields``, as does the
+    original text of any timestamp that would not format back identically.
+    """
+
+    __slots__ = ('id', 'job_url', 'title', 'department', 'team', 'location', 'employment_type', 'is_remote',
+                 'status', 'published_at', 'first_seen', 'last_seen', 'closed_date') + COMPENSATION_FIELDS + (
+                 'parsed_compensation', 'fields')
+
+    # Slot name -> dict key
+    VALUE_SLOTS = {'id': 'id', 'job_url': 'jobUrl', 'title': 'title', 'location': 'location',
+                   'employment_type': 'employmentType', 'is_remote': 'isRemote', 'status': 'status'}
+    INTERNED_SLOTS = {'department': 'department', 'team': 'team'}
+    TIMESTAMP_SLOTS = {'published_at': 'publishedAt', 'first_seen': 'first_seen',
+                       'last_seen': 'last_seen', 'closed_date': 'closed_date'}
+
+    @classmethod
+    def from_dict(cls, job: Dict) -> 'JobRecord':
+        record = cls.__new__(cls)
+        fields = dict(job)
+        for slot, key in cls.VALUE_SLOTS.items():
+            setattr(record, slot, fields.pop(key) if fields.get(key) is not None else None)
+        for slot, key in cls.INTERNED_SLOTS.items():
+            value = fields.get(key)
+            if isinstance(value, str):
+                del fields[key]
+                value = sys.intern(value)
+            else:
+                value = None
+            setattr(record, slot, value)
+        for slot, key in cls.TIMESTAMP_SLOTS.items():
+            text = fields.get(key)
+            value = None
+            if isinstance(text, str):
+                try:
+                    if slot == 'published_at':
+                        value = to_epoch_us(datetime.fromisoformat(text.replace('Z', '+00:00')))
+                    else:
+                        value = timestamp_us(text)
+                    if cls.format_timestamp(slot, value) == text:
+                        del fields[key]
+                except ValueError:
+                    value = None
+            setattr(record, slot, value)
+        # Parsed, and left out of to_dict, only for records saved without the typed fields
+        record.parsed_compensation = tuple(field for field in COMPENSATION_FIELDS if field not in fields)
+        parsed = parse_compensation(fields.get('compensation'))['fields'] if record.parsed_compensation else {}
+        for field in COMPENSATION_FIELDS:
+            setattr(record, field, fields.pop(field) if field in fields else parsed[field])
+        record.fields = fields
+        return record
+
+    @staticmethod
+    def format_timestamp(slot: str, value: int) -> str:
+        if slot == 'published_at':
+            return from_epoch_us(value, aware=True).isoformat(timespec='milliseconds')
+        return from_epoch_us(value).isoformat()
+
+    def to_dict(self) -> Dict:
+        job = {}
+        for slots in (self.VALUE_SLOTS, self.INTERNED_SLOTS):
+            for slot, key in slots.items():
+                if getattr(self, slot) is not None:
+                    job[key] = getattr(self, slot)
+        for slot, key in self.TIMESTAMP_SLOTS.items():
+            if getattr(self, slot) is not None:
+                job[key] = self.format_timestamp(slot, getattr(self, slot))
+        for field in COMPENSATION_FIELDS:
+            if field not in self.parsed_compensation:
+                job[field] = getattr(self, field)
+        job.update(self.fields)
+        return job
+
+    def timestamp(self, slot: str) -> Optional[datetime]:
+        value = getattr(self, slot)
+        if value is None:
+            return None
+        return from_epoch_us(value, aware=(slot == 'published_at'))
+
+class JsonJobStore:
+    """Master job database kept as one pretty-printed JSON file (the default backend)
+
+    Every read parses the whole file, so runs diff against a full load
+    rather than the state index, and ``save`` applies its events to the
+    records that load returned as long as the file has not changed since.
+    """
+
+    # Whether get() reads only the requested records, making the state index worth consulting
+    keyed_reads = False
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.loaded: Optional[Tuple[Tuple, List[Dict]]] = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def file_state(self) -> Optional[Tuple]:
+        if not self.path.exists():
+            return None
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> List[Dict]:
+        self.loaded = None
+        if not self.path.exists():
+            self.loaded = (None, [])
+            return []
+
+        try:
+            state = self.file_state()
+            with open(self.path, 'r') as f:
+                jobs = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load job database: {e}")
+            return []
+        self.loaded = (state, jobs)
+        return jobs
+
+    def get(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        keys = set(keys)
+        if not keys:
+            return {}
+        return {job_key(job): job for job in self.load() if job_key(job) in keys}
+
+    def save(self, events: List[Dict], as_of: datetime) -> List[Dict]:
+        """Apply the events and rewrite the whole file, returning the saved records"""
+        if self.loaded and self.loaded[0] == self.file_state():
+            jobs = self.loaded[1]
+        else:
+            jobs = self.load()
+        self.loaded = None
+        jobs_by_key = {job_key(job): job for job in jobs}
+        for event in events:
+            apply_job_event(jobs_by_key, event)
+        jobs = list(jobs_by_key.values())
+        for job in jobs:
+            refresh_lifecycle_fields(job, as_of)
+
+        with open(self.path, 'w') as f:
+            json.dump(jobs, f, indent=2)
+        logger.info(f"Saved {len(jobs)} jobs to database")
+        return jobs
+
+class SqliteJobStore:
+    """Master job database kept in SQLite, so a run only writes the rows that changed
+
+    Each row holds the full record as JSON next to indexed copies of its
+    lifecycle fields. Fields that only move with the clock (``last_seen``,
+    ``days_since_listed``, ``days_until_deletion``) are not rewritten for
+    unchanged rows - they are recomputed from the last check time on load.
+    Rows are keyed by job_key, with a secondary index on ``job_url``. The
+    first time the database is opened it is seeded from the JSON database,
+    if one exists. ``record_version`` in the meta table notes which record
+    upgrades (see ``OpenAIJobMonitor.upgrade_records``) the rows have had.
+    """
+
+    keyed_reads = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_key TEXT PRIMARY KEY,
+            id TEXT,
+            job_url TEXT NOT NULL,
+            status TEXT NOT NULL,
+            first_seen TEXT,
+            closed_date TEXT,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_id ON jobs (id);
+        CREATE INDEX IF NOT EXISTS jobs_job_url ON jobs (job_url);
+        CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+        CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+        CREATE INDEX IF NOT EXISTS jobs_closed_date ON jobs (closed_date);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    # Host parameters per SELECT ... IN query, under SQLite's default limit
+    QUERY_BATCH = 500
+
+    def __init__(self, path: Path, json_path: Optional[Path] = None):
+        self.path = path
+        self.json_path = json_path
+        self.ready = False
+
+    def connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema and migrating the JSON database on first use"""
+        new_database = not self.path.exists()
+        connection = sqlite3.connect(str(self.path))
+        if not self.ready:
+            connection.executescript(self.SCHEMA)
+            self.ready = True
+            if new_database and self.json_path and self.json_path.exists():
+                self.migrate_from_json(self.json_path, connection)
+        return connection
+
+    def exists(self) -> bool:
+        return self.path.exists() or bool(self.json_path and self.json_path.exists())
+
+    @staticmethod
+    def row(job: Dict) -> Tuple:
+        return (job_key(job), job.get('id'), job['jobUrl'], job['status'], job.get('first_seen'),
+                job.get('closed_date'), json.dumps(job))
+
+    def migrate_from_json(self, json_path: Path, connection: Optional[sqlite3.Connection] = None) -> int:
+        """Replace the contents of this database with the records in a JSON database"""
+        owned = connection is None
+        connection = connection or self.connect()
+        try:
+            with open(json_path, 'r') as f:
+                jobs = json.load(f)
+
+            # Clock-driven fields were current as of the most recent sighting
+            last_check = max((job['last_seen'] for job in jobs if job.get('last_seen')),
+                             default=datetime.now().isoformat())
+            with connection:
+                connection.execute("DELETE FROM jobs")
+                connection.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                       [self.row(job) for job in jobs])
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('last_check', ?)", (last_check,))
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('revision', ?)", (uuid.uuid4().hex,))
+                # The JSON records may predate any upgrade
+                connection.execute("DELETE FROM meta WHERE key = 'record_version'")
+            logger.info(f"Migrated {len(jobs)} jobs from {json_path} to {self.path}")
+            return len(jobs)
+        except Exception as e:
+            logger.error(f"Failed to migrate job database from {json_path}: {e}")
+            return 0
+        finally:
+            if owned:
+                connection.close()
+
+    def select(self, connection: sqlite3.Connection, keys: Optional[List[str]] = None) -> List[Dict]:
+        """Read records - all of them, or just the given keys - with clock-driven fields brought up to date"""
+        last_check = connection.execute("SELECT value FROM meta WHERE key = 'last_check'").fetchone()
+        if keys is None:
+            jobs = [json.loads(record) for record, in
+                    connection.execute("SELECT record FROM jobs ORDER BY first_seen, job_key")]
+        else:
+            jobs = []
+            for start in range(0, len(keys), self.QUERY_BATCH):
+                batch = keys[start:start + self.QUERY_BATCH]
+                query = f"SELECT record FROM jobs WHERE job_key IN ({', '.join('?' * len(batch))})"
+                jobs.extend(json.loads(record) for record, in connection.execute(query, batch))
+
+        if last_check:
+            as_of = datetime.fromisoformat(last_check[0])
+            for job in jobs:
+                refresh_lifecycle_fields(job, as_of)
+        return jobs
+
+    def load(self) -> List[Dict]:
+        try:
+            connection = self.connect()
+            try:
+                return self.select(connection)
+            finally:
+                connection.close()
+        except Exception as e:
+            logger.error(f"Failed to load job database: {e}")
+            return []
+
+    def revision(self) -> str:
+        """Identifies the current contents - a new value is written with every change"""
+        connection = self.connect()
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        finally:
+            connection.close()
+        return row[0] if row else ''
+
+    def record_version(self) -> int:
+        connection = self.connect()
+        try:
+            row = connection.execute("SELECT value FROM meta WHERE key = 'record_version'").fetchone()
+        finally:
+            connection.close()
+        return int(row[0]) if row else 0
+
+    def set_record_version(self, version: int):
+        connection = self.connect()
+        try:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('record_version', ?)", (str(version),))
+        finally:
+            connection.close()
+
+    def get(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        connection = self.connect()
+        try:
+            return {job_key(job): job for job in self.select(connection, keys)}
+        finally:
+            connection.close()
+
+    def save(self, events: List[Dict], as_of: datetime) -> Optional[List[Dict]]:
+        """Upsert the rows touched by the events in a single transaction"""
+        connection = self.connect()
+        try:
+            touched = {job_key(event) for event in events}
+            touched.update(event['previous_key'] for event in events if event['type'] == 'REMAPPED')
+            touched = list(touched)
+            jobs_by_key = {job_key(job): job for job in self.select(connection, touched)}
+            for event in events:
+                apply_job_event(jobs_by_key, event)
+            for job in jobs_by_key.values():
+                refresh_lifecycle_fields(job, as_of)
+            purged = [(key,) for key in touched if key not in jobs_by_key]
+
+            with connection:
+                connection.executemany("DELETE FROM jobs WHERE job_key = ?", purged)
+                connection.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                       [self.row(job) for job in jobs_by_key.values()])
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('last_check', ?)",
+                                   (as_of.isoformat(),))
+                connection.execute("INSERT OR REPLACE INTO meta VALUES ('revision', ?)", (uuid.uuid4().hex,))
+            logger.info(f"Saved job database ({len(jobs_by_key)} rows written, {len(purged)} removed)")
+        finally:
+            connection.close()
+        return None
+
+class EventLogJobStore:
+    """Master job database kept as a compacted snapshot plus an append-only lifecycle event log
+
+    Each run appends one JSON line per OPENED, REMAPPED, UPDATED, CLOSED or
+    PURGED event, so write I/O scales with the amount of change rather than the
+    size of the database. A run without changes appends a single CHECKED
+    marker so the check time is still recorded. The current state is the
+    snapshot with the log tail replayed over it. Once the log outgrows
+    ``event_log_compact_bytes`` or its oldest event is older than
+    ``event_log_compact_days``, the state is written out as a new snapshot
+    and the old log is gzipped into ``events/`` to keep the audit trail.
+    Replaying events is idempotent, so a crash between writing the snapshot
+    and rotating the log is harmless.
+    """
+
+    # Reads replay the whole log, so runs diff against a full load
+    keyed_reads = False
+
+    def __init__(self, snapshot_path: Path, log_path: Path, archive_dir: Path,
+                 json_path: Optional[Path] = None, compact_bytes: int = 1024 * 1024,
+                 compact_days: float = 7):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.archive_dir = archive_dir
+        self.json_path = json_path
+        self.compact_bytes = compact_bytes
+        self.compact_days = compact_days
+
+    def exists(self) -> bool:
+        return (self.snapshot_path.exists() or self.log_path.exists()
+                or bool(self.json_path and self.json_path.exists()))
+
+    def load(self) -> List[Dict]:
+        try:
+            if self.snapshot_path.exists():
+                with open(self.snapshot_path, 'r') as f:
+                    snapshot = json.load(f)
+            elif self.json_path and self.json_path.exists():
+                # Seed from the JSON database the first time this backend is used
+                with open(self.json_path, 'r') as f:
+                    jobs = json.load(f)
+                snapshot = {'last_check': max((job['last_seen'] for job in jobs if job.get('last_seen')),
+                                              default=None),
+                            'jobs': jobs}
+                logger.info(f"Seeding event log database from {self.json_path}")
+            else:
+                snapshot = {'last_check': None, 'jobs': []}
+
+            jobs_by_key = {job_key(job): job for job in snapshot['jobs']}
+            last_check = snapshot['last_check']
+            if self.log_path.exists():
+                with open(self.log_path, 'r') as f:
+                    for line_number, line in enumerate(f, 1):
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            # A run interrupted mid-append leaves a partial last line
+                            logger.warning(f"Skipping unreadable event on line {line_number} of {self.log_path}")
+                            continue
+                        if event['type'] != 'CHECKED':
+                            apply_job_event(jobs_by_key, event)
+                        last_check = event['at']
+        except Exception as e:
+            logger.error(f"Failed to load job database: {e}")
+            return []
+
+        jobs = list(jobs_by_key.values())
+        if last_check:
+            as_of = datetime.fromisoformat(last_check)
+            for job in jobs:
+                refresh_lifecycle_fields(job, as_of)
+        return jobs
+
+    def get(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        keys = set(keys)
+        if not keys:
+            return {}
+        return {job_key(job): job for job in self.load() if job_key(job) in keys}
+
+    def save(self, events: List[Dict], as_of: datetime) -> Optional[List[Dict]]:
+        """Append the events, compacting the log once it is too large or too old
+
+        Returns the saved records when compaction had to materialize them.
+        """
+        if not self.snapshot_path.exists() and not self.log_path.exists():
+            # Start from a snapshot, so the log only ever holds changes
+            return self.compact(events, as_of)
+
+        lines = [json.dumps(event, separators=(',', ':'))
+                 for event in events or [{'type': 'CHECKED', 'at': as_of.isoformat()}]]
+        with open(self.log_path, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+        logger.info(f"Saved job database ({len(lines)} events logged)")
+
+        if self.should_compact(as_of):
+            return self.compact([], as_of)
+        return None
+
+    def should_compact(self, as_of: datetime) -> bool:
+        if self.log_path.stat().st_size >= self.compact_bytes:
+            return True
+        with open(self.log_path, 'r') as f:
+            first_event = json.loads(f.readline())
+        return (as_of - datetime.fromisoformat(first_event['at'])).total_seconds() >= self.compact_days * 86400
+
+    def compact(self, events: List[Dict], as_of: datetime) -> List[Dict]:
+        """Write the current state, plus any further events, as the snapshot and archive the log it replaces"""
+        jobs_by_key = {job_key(job): job for job in self.load()}
+        for event in events:
+            apply_job_event(jobs_by_key, event)
+        jobs = list(jobs_by_key.values())
+        for job in jobs:
+            refresh_lifecycle_fields(job, as_of)
+
+        temp_path = self.snapshot_path.with_name(self.snapshot_path.name + '.part')
+        with open(temp_path, 'w') as f:
+            json.dump({'compacted_at': datetime.now().isoformat(), 'last_check': as_of.isoformat(),
+                       'jobs': jobs}, f, separators=(',', ':'))
+        temp_path.replace(self.snapshot_path)
+        logger.info(f"Saved {len(jobs)} jobs to database snapshot")
+
+        if self.log_path.exists():
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            archive_file = self.archive_dir / f"{self.log_path.stem}_{as_of.strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+            with open(self.log_path, 'rb') as source, gzip.open(archive_file, 'wb') as target:
+                shutil.copyfileobj(source, target)
+            self.log_path.unlink()
+            logger.info(f"Compacted event log into {self.snapshot_path.name}, archived as {archive_file.name}")
+        return jobs
+
+class DescriptionStore:
+    """Content-addressed store of compressed job descriptions
+
+    Descriptions are most of the bytes in every job record yet rarely change,
+    so records only keep the SHA-256 of each one under ``description_blobs``.
+    The text is written once, gzipped, to ``<hash[:2]>/<hash>.gz`` however
+    many files, profiles and revisions refer to it, and is only read back
+    when something asks for it.
+
+    When a posting's description is edited, the previous text is rewritten
+    as ``<hash>.delta.gz``: a delta against the new text. Old hashes keep
+    resolving by walking the chain of deltas to the latest full text, so
+    storage grows with the size of the edits. ``history.json`` lists the
+    revisions of each job by its lifecycle key.
+    """
+
+    FIELDS = ('descriptionHtml', 'descriptionPlain')
+
+    # Delta tokens end after a newline, a sentence or an HTML tag
+    TOKEN_BOUNDARY = re.compile(r'(?<=[\n.>])')
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.history_file = root / "history.json"
+        self.cache: Dict[str, str] = {}
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def delta_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.delta.gz"
+
+    def write(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + '.part')
+        with gzip.open(temp_path, 'wb') as f:
+            f.write(data)
+        temp_path.replace(path)
+
+    def put(self, text: str) -> str:
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.blob_path(digest).exists():
+            # A text that comes back after an edit is stored in full again
+            self.write(self.blob_path(digest), data)
+            if self.delta_path(digest).exists():
+                self.delta_path(digest).unlink()
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        if digest in self.cache:
+            return self.cache[digest]
+
+        # Follow deltas until a full text, then apply them back in reverse
+        chain = []
+        current = digest
+        try:
+            while not self.blob_path(current).exists():
+                with gzip.open(self.delta_path(current), 'rb') as f:
+                    delta = json.loads(f.read().decode('utf-8'))
+                chain.append((current, delta['ops']))
+                current = delta['base']
+                if len(chain) > 1000:
+                    raise ValueError("delta chain too long")
+            with gzip.open(self.blob_path(current), 'rb') as f:
+                text = f.read().decode('utf-8')
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read description {digest}: {e}")
+            return None
+
+        self.cache[current] = text
+        for chained_digest, ops in reversed(chain):
+            text = self.apply_delta(text, ops)
+            self.cache[chained_digest] = text
+        return text
+
+    @classmethod
+    def make_delta(cls, base: str, text: str) -> List:
+        """Ops rebuilding ``text`` from ``base``: [start, end] copies base tokens, a string is inserted"""
+        base_tokens = cls.TOKEN_BOUNDARY.split(base)
+        tokens = cls.TOKEN_BOUNDARY.split(text)
+        ops = []
+        matcher = difflib.SequenceMatcher(None, base_tokens, tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                ops.append([i1, i2])
+            elif j2 > j1:
+                ops.append(''.join(tokens[j1:j2]))
+        return ops
+
+    @classmethod
+    def apply_delta(cls, base: str, ops: List) -> str:
+        base_tokens = cls.TOKEN_BOUNDARY.split(base)
+        return ''.join(op if isinstance(op, str) else ''.join(base_tokens[op[0]:op[1]]) for op in ops)
+
+    def store_as_delta(self, digest: str, base_digest: str):
+        """Replace the full text of an old revision with a delta against its successor"""
+        # Only delta against another, full text, so chains can never loop back on themselves
+        if digest == base_digest or not self.blob_path(digest).exists() or not self.blob_path(base_digest).exists():
+            return
+        text = self.get(digest)
+        base = self.get(base_digest)
+        if text is None or base is None:
+            return
+        delta = {'base': base_digest, 'ops': self.make_delta(base, text)}
+        self.write(self.delta_path(digest), json.dumps(delta, separators=(',', ':')).encode('utf-8'))
+        self.blob_path(digest).unlink()
+
+    def externalize(self, job: Dict):
+        """Move a job's descriptions into the store, leaving their hashes behind"""
+        blobs = job.get('description_blobs') or {}
+        for field in self.FIELDS:
+            text = job.pop(field, None)
+            if text is not None:
+                blobs[field] = self.put(text)
+        if blobs:
+            job['description_blobs'] = blobs
+
+    def load_history(self) -> Dict[str, List[Dict]]:
+        if not self.history_file.exists():
+            return {}
+        try:
+            with open(self.history_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load description history: {e}")
+            return {}
+
+    def record_revisions(self, revisions: List[Tuple[str, str, str, Dict, Dict, Optional[str]]]):
+        """Add edited descriptions to the history and delta-encode the texts they replace
+
+        Each revision is (job key, jobUrl, timestamp, old hashes, new hashes,
+        first_seen) with hashes keyed by description field. A job's first
+        revision is added, dated from when it was first seen, the first time
+        it changes.
+        """
+        history = self.load_history()
+        for key, job_url, at, old_blobs, new_blobs, first_seen in revisions:
+            job_history = history.setdefault(key, [])
+            if not job_history:
+                job_history.append(dict(old_blobs, at=first_seen, jobUrl=job_url))
+            if {field: job_history[-1].get(field) for field in self.FIELDS} == new_blobs:
+                continue  # Already recorded, e.g. by another profile
+            job_history.append(dict(new_blobs, at=at, jobUrl=job_url))
+            for field in self.FIELDS:
+                # A field the edit left alone is still current, so keeps its full text
+                if old_blobs.get(field) and new_blobs.get(field) and old_blobs[field] != new_blobs[field]:
+                    self.store_as_delta(old_blobs[field], new_blobs[field])
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, 'w') as f:
+            json.dump(history, f, indent=2)
+
+class ClosedJobArchive:
+    """Monthly compressed partitions of jobs that have left the master database
+
+    Jobs closed for the whole retention window are appended to
+    ``closed_jobs_<YYYY-MM>.jsonl.gz``, partitioned by the month they closed.
+    Each run's batch becomes one more gzip member of the file. ``manifest.json``
+    records the job count and closing date range of every partition, so a
+    query only opens the months it asks for.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.manifest_file = root / "manifest.json"
+
+    def load_manifest(self) -> Dict:
+        if not self.manifest_file.exists():
+            return {'partitions': {}}
+        with open(self.manifest_file, 'r') as f:
+            return json.load(f)
+
+    def append(self, jobs: List[Dict], archived_at: datetime):
+        """Add jobs to the partitions for the months they closed in"""
+        by_month: Dict[str, List[Dict]] = {}
+        for job in jobs:
+            by_month.setdefault(job['closed_date'][:7], []).append(dict(job, archived_at=archived_at.isoformat()))
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+        for month, month_jobs in sorted(by_month.items()):
+            partition = manifest['partitions'].setdefault(month, {
+                'file': f"closed_jobs_{month}.jsonl.gz",
+                'jobs': 0,
+                'first_closed': month_jobs[0]['closed_date'],
+                'last_closed': month_jobs[0]['closed_date']
+            })
+            with gzip.open(self.root / partition['file'], 'at', encoding='utf-8') as f:
+                for job in month_jobs:
+                    f.write(json.dumps(job, separators=(',', ':')) + '\n')
+            partition['jobs'] += len(month_jobs)
+            partition['first_closed'] = min([partition['first_closed']] + [job['closed_date'] for job in month_jobs])
+            partition['last_closed'] = max([partition['last_closed']] + [job['closed_date'] for job in month_jobs])
+
+        manifest['updated_at'] = archived_at.isoformat()
+        temp_path = self.manifest_file.with_name(self.manifest_file.name + '.part')
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        temp_path.replace(self.manifest_file)
+
+    def iter_jobs(self, since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict]:
+        """Archived jobs that closed between two YYYY-MM months, inclusive, reading only those partitions"""
+        for month, partition in sorted(self.load_manifest()['partitions'].items()):
+            if (since and month < since) or (until and month > until):
+                continue
+            with gzip.open(self.root / partition['file'], 'rt', encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+
+class JobStateIndex:
+    """Compact binary sidecar holding only what lifecycle diffing needs for each job
+
+    The file starts with a magic number, the database backend it describes,
+    the store revision it was built against and a record count. A store
+    rewritten behind the index - restored, migrated or re-seeded - has a new
+    revision, so the index is rebuilt rather than trusted. Each job is then a
+    fixed-width header - content hash, status, and
+    ``first_seen``/``last_seen``/``closed_date`` as microseconds since the
+    epoch (0 when unset) - followed by its job_key and jobUrl.
+    Entries are keyed by job_key, with ``by_url`` mapping each jobUrl back to
+    its key so a posting that changes id or URL can be matched up. Diffing a
+    run against it needs no job records at all; only records for jobs that
+    are new, changed, re-keyed, closing or due for removal are read from the
+    database.
+    """
+
+    MAGIC = b'JSIX1'
+    HEADER = struct.Struct('<I')
+    RECORD = struct.Struct('<16s B q q q H H')
+    STATUSES = ('ACTIVE', 'CLOSED')
+
+    def __init__(self, path: Path, backend: str):
+        self.path = path
+        self.backend = backend
+        self.entries: Dict[str, List] = {}
+        self.by_url: Dict[str, str] = {}
+
+    @staticmethod
+    def content_hash(job: Dict) -> bytes:
+        """The job's fingerprint, computed here only for records saved without one"""
+        return bytes.fromhex(job.get('fingerprint') or job_fingerprint(job))
+
+    @staticmethod
+    def to_epoch(timestamp: Optional[str]) -> int:
+        return timestamp_us(timestamp) if timestamp else 0
+
+    @staticmethod
+    def from_epoch(value: int) -> Optional[datetime]:
+        return from_epoch_us(value) if value else None
+
+    def set(self, job: Dict, content_hash: Optional[bytes] = None):
+        """Record a job's current state, hashing its content unless the hash is given"""
+        key = job_key(job)
+        previous = self.entries.get(key)
+        if previous and self.by_url.get(previous[5]) == key:
+            del self.by_url[previous[5]]
+        self.entries[key] = [
+            content_hash or self.content_hash(job),
+            job['status'],
+            self.to_epoch(job.get('first_seen')),
+            self.to_epoch(job.get('last_seen')),
+            self.to_epoch(job.get('closed_date')),
+            job['jobUrl']
+        ]
+        self.by_url[job['jobUrl']] = key
+
+    def rekey(self, previous_key: str, key: str, job_url: str):
+        """Move an entry to a job's new key and URL"""
+        entry = self.entries[previous_key]
+        self.remove(previous_key)
+        entry[5] = job_url
+        self.entries[key] = entry
+        self.by_url[job_url] = key
+
+    def remove(self, key: str):
+        entry = self.entries.pop(key)
+        if self.by_url.get(entry[5]) == key:
+            del self.by_url[entry[5]]
+
+    def rebuild(self, jobs: List[Dict]):
+        self.entries = {}
+        self.by_url = {}
+        for job in jobs:
+            self.set(job)
+
+    def header(self, revision: str) -> bytes:
+        backend = self.backend.encode('utf-8')
+        revision = revision.encode('utf-8')
+        return self.MAGIC + bytes([len(backend)]) + backend + bytes([len(revision)]) + revision
+
+    def load(self, revision: str) -> bool:
+        """Read the index, returning False if it is missing, unreadable or describes another backend or revision"""
+        if not self.path.exists():
+            return False
+
+        try:
+            data = self.path.read_bytes()
+            prefix = self.header(revision)
+            if not data.startswith(prefix):
+                return False
+            offset = len(prefix)
+            count, = self.HEADER.unpack_from(data, offset)
+            offset += self.HEADER.size
+
+            entries = {}
+            for _ in range(count):
+                content_hash, status, first_seen, last_seen, closed_date, key_length, url_length = \
+                    self.RECORD.unpack_from(data, offset)
+                offset += self.RECORD.size
+                key = data[offset:offset + key_length].decode('utf-8')
+                offset += key_length
+                job_url = data[offset:offset + url_length].decode('utf-8')
+                offset += url_length
+                entries[key] = [content_hash, self.STATUSES[status], first_seen, last_seen, closed_date, job_url]
+            if offset != len(data):
+                # Slicing past the end does not raise, so a file cut short in its last key or URL ends up here
+                raise ValueError(f"expected {offset} bytes, found {len(data)}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable state index {self.path}: {e}")
+            return False
+
+        self.entries = entries
+        self.by_url = {entry[5]: key for key, entry in entries.items()}
+        return True
+
+    def save(self, revision: str):
+        parts = [self.header(revision), self.HEADER.pack(len(self.entries))]
+        for key, (content_hash, status, first_seen, last_seen, closed_date, job_url) in self.entries.items():
+            key_bytes = key.encode('utf-8')
+            url_bytes = job_url.encode('utf-8')
+            parts.append(self.RECORD.pack(content_hash, self.STATUSES.index(status), first_seen, last_seen,
+                                          closed_date, len(key_bytes), len(url_bytes)))
+            parts.append(key_bytes)
+            parts.append(url_bytes)
+
+        temp_path = self.path.with_name(self.path.name + '.part')
+        temp_path.write_bytes(b''.join(parts))
+        temp_path.replace(self.path)
+
+    def delete(self):
+        if self.path.exists():
+            self.path.unlink()
+
 class OpenAIJobMonitor:
     """Monitor OpenAI jobs using Ashby's public API with lifecycle tracking"""
     
-    def __init__(self, config: Dict):
-        self.config = config
-        self.api_url = "https://api.ashbyhq.com/posting-api/job-board/openai?includeCompensation=true"
-        self.data_dir = Path("job_data")
-        self.data_dir.mkdir(exist_ok=True)
+    # Number of past runs kept in the run ledger
+    RUN_LEDGER_LIMIT = 500
+    
+    # Record versions, one per upgrade in upgrade_records, in the order they are applied
+    RECORD_COMPENSATION_FIELDS = 1
+    RECORD_EXTERNAL_DESCRIPTIONS = 2
+    
+    # Bytes read per chunk when stream_parse is enabled
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # Board assumed for records saved before multi-board support
+    DEFAULT_BOARD = 'openai'
+    
+    # Per-board fetch state kept even when there is no local data to fall back on
+    BREAKER_FIELDS = ('consecutive_failures', 'circuit_open_until')
+    
+    # Config that decides which fetched jobs are kept - stored validators only hold while it is unchanged
+    FILTER_CONFIG_KEYS = ('location_keywords', 'include_remote', 'job_filter', 'profiles', 'reference_currency',
+                          'fx_rates_file')
+    
+    def __init__(self, config: Dict, data_dir: Optional[Path] = None):
+        self.config = config
+        self.profile_name = config.get('profile_name')
+        self.label = config.get('label') or 'San Francisco'
+        self.api_url = config.get('api_url') or "https://api.ashbyhq.com/posting-api/job-board/{board}?includeCompensation=true"
+        self.boards = config.get('boards') or [self.DEFAULT_BOARD]
+        self.location_matcher = LocationMatcher(
+            config.get('location_keywords') or ['san francisco', 'sf', 'bay area'],
+            include_remote='remote' in config.get('include_remote', [])
+        )
+        
+        # Puts salaries in different currencies and pay intervals on one yearly scale
+        self.salary_normalizer = SalaryNormalizer(Path(config.get('fx_rates_file', 'fx_rates.json')),
+                                                  config.get('reference_currency', 'USD'))
+        self.job_filter = JobFilter(config.get('job_filter'), self.location_matcher, self.salary_normalizer)
+        self.filter_hash = hashlib.sha256(json.dumps(
+            {key: config.get(key) for key in self.FILTER_CONFIG_KEYS}, sort_keys=True, default=str
+        ).encode('utf-8')).hexdigest()
+        self.max_workers = max(1, min(config.get('max_concurrent_fetches', 8), len(self.boards)))
+        
+        # One keep-alive connection pool shared by all board fetches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self.data_dir = Path(data_dir or "job_data")
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Files for tracking
+        self.current_jobs_file = self.data_dir / "current_openai_jobs.json"
+        self.master_database_file = self.data_dir / "openai_jobs_database.json"
+        self.job_store = self.create_job_store()
+        self.state_index = JobStateIndex(self.data_dir / "openai_jobs_state.idx",
+                                         self.config.get('database_backend', 'json'))
+        self.fetch_state_file = self.data_dir / "fetch_state.json"
+        self.run_ledger_file = self.data_dir / "run_ledger.json"
+        self.snapshots_dir = self.data_dir / "snapshots"
+        self.report_file = self.data_dir / f"openai_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        self.csv_file = self.data_dir / f"openai_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        
+        # Conditional GET state - set by fetch_jobs, persisted once a check completes
+        self.board_unchanged = False
+        self.fetch_outcome = None
+        self.board_outcomes = {}
+        self.pending_fetch_state = None
+        self.jobs_scanned = 0
+        
+        # Snapshot being recorded by the current fetch, or being replayed instead of the API
+        self.snapshot_dir = None
+        self.replay_snapshot = None
+        
+        # Field-level changes to existing jobs found by the last update, and those that moved compensation
+        self.job_changes = []
+        self.compensation_changes = []
+        
+        # Database as saved by the last update, when the backend had it in memory - reused by the dashboard export
+        self.current_database = None
+        
+        # Jobs that left the database after closing, kept per profile
+        self.archive = ClosedJobArchive(self.data_dir / "archive") if config.get('archive_closed_jobs', True) else None
+        
+        # Cleans compensation summaries for reports, CSV and email
+        self.normalize_text = TextNormalizer(config.get('strip_non_ascii', True))
+        
+        # Job descriptions are kept out of the records, in a store shared with any profiles
+        self.descriptions = (DescriptionStore(self.data_dir / "descriptions")
+                             if config.get('externalize_descriptions', True) else None)
+        
+        # Profiles evaluated against each fetch, and which profiles each fetched job matched
+        self.profiles = self.build_profiles()
+        self.profile_matches = {}
+    
+    def build_profiles(self) -> List['OpenAIJobMonitor']:
+        """Create one monitor per configured profile, or use this monitor when there are none
+        
+        Each entry in the ``profiles`` config section overrides the top-level
+        settings (filters, label, email targets, ...) for that profile. A
+        profile keeps its own database, dashboard, reports and CSVs in
+        ``job_data/<name>/`` but never fetches: it processes the jobs this
+        monitor fetched.
+        """
+        profiles_config = self.config.get('profiles')
+        if not profiles_config:
+            return [self]
+        
+        profiles = []
+        for name, overrides in profiles_config.items():
+            profile_config = {key: value for key, value in self.config.items() if key != 'profiles'}
+            profile_config.update(overrides)
+            profile_config['profile_name'] = name
+            profile = OpenAIJobMonitor(profile_config, self.data_dir / name)
+            profile.descriptions = self.descriptions
+            profiles.append(profile)
+        return profiles
+    
+    def load_fetch_state(self) -> Dict:
+        """Load the per-board HTTP validators stored from the last successful fetch"""
+        if not self.fetch_state_file.exists():
+            return {'boards': {}}
+        
+        try:
+            with open(self.fetch_state_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load fetch state: {e}")
+            return {'boards': {}}
+    
+    def save_fetch_state(self):
+        """Persist the validators from the last fetch so the next run can send a conditional GET"""
+        if self.pending_fetch_state is None:
+            return
+        
+        try:
+            with open(self.fetch_state_file, 'w') as f:
+                json.dump(self.pending_fetch_state, f, indent=2)
+            self.pending_fetch_state = None
+        except Exception as e:
+            logger.error(f"Failed to save fetch state: {e}")
+    
+    def record_run(self, status: str, started_at: datetime, **details):
+        """Append an entry for this run to the run ledger"""
+        ledger = []
+        if self.run_ledger_file.exists():
+            try:
+                with open(self.run_ledger_file, 'r') as f:
+                    ledger = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to load run ledger: {e}")
+        
+        entry = {
+            'started_at': started_at.isoformat(),
+            'duration_seconds': round((datetime.now() - started_at).total_seconds(), 3),
+            'status': status,
+        }
+        entry.update(details)
+        ledger.append(entry)
+        
+        try:
+            with open(self.run_ledger_file, 'w') as f:
+                json.dump(ledger[-self.RUN_LEDGER_LIMIT:], f, indent=2)
+        except Exception as e:
+            logger.error(f"Failed to save run ledger: {e}")
+    
+    def has_local_state(self) -> bool:
+        """Check whether a previous run left data we can fall back on when a board is unchanged"""
+        return (self.current_jobs_file.exists()
+                and all(profile.job_store.exists() for profile in self.profiles))
+    
+    def build_conditional_headers(self, board_state: Dict) -> Dict:
+        """Build If-None-Match / If-Modified-Since headers from a board's stored validators"""
+        headers = {}
+        if board_state.get('etag'):
+            headers['If-None-Match'] = board_state['etag']
+        if board_state.get('last_modified'):
+            headers['If-Modified-Since'] = board_state['last_modified']
+        return headers
+    
+    def fetch_jobs(self, job_filter: Optional[Callable[[Dict], bool]] = None) -> Optional[List[Dict]]:
+        """Fetch current jobs from every configured Ashby board
         
-        # Files for tracking
-        self.current_jobs_file = self.data_dir / "current_openai_jobs.json"
-        self.master_database_file = self.data_dir / "openai_jobs_database.json"
-        self.report_file = self.data_dir / f"openai_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        self.csv_file = self.data_dir / f"openai_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        Boards are fetched concurrently over one pooled session, all sharing
+        a single ``fetch_deadline`` budget for the run. Each board is sent a
+        conditional GET using the validators from the last run. If a board
+        answers 304 or its raw body hashes the same as last time, its jobs
+        are carried forward from the current jobs file instead of being
+        parsed. Validators stored under a different filter config are not
+        used, since the carried-forward jobs were filtered with it. A board
+        that fails to fetch, or whose circuit breaker is open, is carried
+        forward too, so its jobs are not marked closed.
+        When no board returned new data, ``board_unchanged`` is set and an
+        empty list is returned.
+        
+        If ``job_filter`` is given only matching jobs are returned.
+        """
+        self.board_unchanged = False
+        self.fetch_outcome = None
+        self.board_outcomes = {}
+        self.jobs_scanned = 0
+        self.profile_matches = {}
+        
+        board_states = self.load_fetch_state()['boards']
+        if not self.has_local_state():
+            # Without local data a 304 would leave us with nothing to work from,
+            # so only the circuit breaker state is kept
+            board_states = {board: {key: state[key] for key in self.BREAKER_FIELDS if key in state}
+                            for board, state in board_states.items()}
+        else:
+            # Jobs kept under an older filter config would be carried forward as if still current
+            stale_boards = [board for board, state in board_states.items()
+                            if state.get('filter_hash') != self.filter_hash]
+            if stale_boards:
+                logger.info(f"Filter config changed since the last fetch of: {', '.join(sorted(stale_boards))}")
+            for board in stale_boards:
+                board_states[board] = {key: board_states[board][key]
+                                       for key in self.BREAKER_FIELDS if key in board_states[board]}
+        
+        if self.replay_snapshot:
+            # The replay rewrites the database and current jobs, so the live
+            # validators no longer describe them - only the breaker state is kept
+            self.pending_fetch_state = {'boards': {
+                board: {key: state[key] for key in self.BREAKER_FIELDS if key in state}
+                for board, state in self.load_fetch_state()['boards'].items()
+            }}
+            board_states = {}
+        elif self.config.get('record_snapshots', False):
+            self.start_snapshot()
+        
+        deadline = time.monotonic() + self.config.get('fetch_deadline', 300)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                lambda board: self.fetch_board(board, board_states.get(board, {}), job_filter, deadline),
+                self.boards
+            ))
+        
+        self.board_outcomes = {result['board']: result['outcome'] for result in results}
+        outcomes = set(self.board_outcomes.values())
+        
+        if self.snapshot_dir:
+            self.finish_snapshot(results)
+        
+        if not self.replay_snapshot:
+            new_states = {board: board_states[board] for board in self.boards if board in board_states}
+            for result in results:
+                if result['fetch_state']:
+                    new_states[result['board']] = result['fetch_state']
+            self.pending_fetch_state = {'boards': new_states}
+        
+        if outcomes <= {'failed', 'circuit_open'}:
+            return None
+        
+        if 'fetched' not in outcomes:
+            self.board_unchanged = True
+            self.fetch_outcome = 'same_content' if 'same_content' in outcomes else 'not_modified'
+            return []
+        
+        jobs = []
+        carried_boards = {result['board'] for result in results if result['outcome'] != 'fetched'}
+        if carried_boards:
+            jobs.extend(job for job in self.load_current_jobs()
+                        if job.get('board', self.DEFAULT_BOARD) in carried_boards)
+            logger.info(f"Carried forward {len(jobs)} jobs from boards: {', '.join(sorted(carried_boards))}")
+        
+        for result in results:
+            jobs.extend(result['jobs'])
+            self.jobs_scanned += result['jobs_scanned']
+        
+        for job in jobs:
+            if self.descriptions:
+                self.descriptions.externalize(job)
+            job['fingerprint'] = job_fingerprint(job)
+        
+        if self.replay_snapshot:
+            self.fetch_outcome = 'replayed'
+        else:
+            self.fetch_outcome = 'partial' if outcomes & {'failed', 'circuit_open'} else 'fetched'
+        logger.info(f"Successfully fetched {self.jobs_scanned} jobs from {len(self.boards)} board(s)")
+        if job_filter:
+            logger.info(f"Filtered to {len(jobs)} matching jobs")
+        return jobs
     
-    def fetch_jobs(self) -> Optional[List[Dict]]:
-        """Fetch current jobs from OpenAI's Ashby API"""
-        try:
-            logger.info("Fetching jobs from OpenAI Ashby API...")
-            response = requests.get(self.api_url, timeout=30)
+    def fetch_board(self, board: str, board_state: Dict,
+                    job_filter: Optional[Callable[[Dict], bool]], deadline: float) -> Dict:
+        """Fetch a single Ashby board with retries and a per-board circuit breaker
+        
+        Transient failures (connection errors, timeouts, 429/5xx responses
+        and truncated bodies) are retried with jittered exponential backoff
+        until ``fetch_retries`` or the run deadline is used up. After
+        ``circuit_breaker_threshold`` consecutive failed runs the board is
+        skipped for ``circuit_breaker_cooldown_hours``, then tried once more
+        without retries.
+        
+        Returns a result dict with the board's ``outcome`` (fetched,
+        not_modified, same_content, failed or circuit_open), its matching
+        ``jobs`` tagged with the board name, the number of jobs scanned and
+        the new ``fetch_state`` to store for the board.
+        """
+        result = {'board': board, 'outcome': 'failed', 'jobs': [], 'jobs_scanned': 0, 'fetch_state': None}
+        
+        if self.replay_snapshot:
+            try:
+                result.update(self.replay_board(board, job_filter))
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to replay board '{board}' from snapshot: {e}")
+            return result
+        
+        open_until = board_state.get('circuit_open_until')
+        if open_until and datetime.now() < datetime.fromisoformat(open_until):
+            logger.warning(f"Circuit open for board '{board}' until {open_until}, skipping fetch")
+            result['outcome'] = 'circuit_open'
+            return result
+        
+        # A half-open circuit gets a single probe request
+        attempts = 1 if open_until else 1 + self.config.get('fetch_retries', 3)
+        for attempt in range(attempts):
+            try:
+                result.update(self.fetch_board_once(board, board_state, job_filter, deadline))
+                if result['fetch_state'] is None:
+                    # Unchanged board - keep its validators but clear any failure history
+                    result['fetch_state'] = {key: value for key, value in board_state.items()
+                                             if key not in self.BREAKER_FIELDS}
+                return result
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code
+                logger.error(f"Failed to fetch jobs from board '{board}': {e}")
+                if status != 429 and status < 500:
+                    break
+                retry_after = e.response.headers.get('Retry-After', '')
+                delay = max(self.retry_delay(attempt), float(retry_after) if retry_after.isdigit() else 0)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                logger.error(f"Failed to fetch jobs from board '{board}': {e}")
+                delay = self.retry_delay(attempt)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to fetch jobs from board '{board}': {e}")
+                break
+            except ValueError as e:  # JSONDecodeError or invalid UTF-8, usually a truncated body
+                logger.error(f"Failed to parse response from board '{board}': {e}")
+                delay = self.retry_delay(attempt)
+            
+            if attempt == attempts - 1:
+                break
+            if time.monotonic() + delay >= deadline:
+                logger.error(f"Fetch deadline reached, giving up on board '{board}'")
+                break
+            logger.info(f"Retrying board '{board}' in {delay:.1f}s (attempt {attempt + 2}/{attempts})")
+            time.sleep(delay)
+        
+        failures = board_state.get('consecutive_failures', 0) + 1
+        result['fetch_state'] = dict(board_state, consecutive_failures=failures)
+        result['fetch_state'].pop('circuit_open_until', None)
+        if failures >= self.config.get('circuit_breaker_threshold', 3):
+            open_until = datetime.now() + timedelta(hours=self.config.get('circuit_breaker_cooldown_hours', 6))
+            result['fetch_state']['circuit_open_until'] = open_until.isoformat()
+            logger.warning(f"Board '{board}' failed {failures} runs in a row, opening circuit until {open_until.isoformat()}")
+        return result
+    
+    def retry_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt"""
+        base = self.config.get('retry_backoff_base', 1.0)
+        cap = self.config.get('retry_backoff_max', 30.0)
+        return random.uniform(0, min(cap, base * 2 ** attempt))
+    
+    def fetch_board_once(self, board: str, board_state: Dict,
+                         job_filter: Optional[Callable[[Dict], bool]], deadline: float) -> Dict:
+        """Make a single fetch attempt for a board, raising on any failure
+        
+        With ``stream_parse`` enabled the response is decoded one job at a
+        time and the filter runs inline, so non-matching jobs are discarded
+        as soon as they are parsed instead of being kept alongside the whole
+        board.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("Fetch deadline exceeded")
+        
+        timeout = (self.config.get('connect_timeout', 5), min(self.config.get('read_timeout', 30), remaining))
+        logger.info(f"Fetching jobs from Ashby board '{board}'...")
+        response = self.session.get(self.api_url.format(board=board),
+                                    headers=self.build_conditional_headers(board_state),
+                                    timeout=timeout, stream=True)
+        with response:
+            if response.status_code == 304:
+                logger.info(f"Board '{board}' not modified since last fetch (304)")
+                return {'outcome': 'not_modified', 'fetch_state': None}
+            
             response.raise_for_status()
             
-            data = response.json()
-            jobs = data.get('jobs', [])
+            hasher = hashlib.sha256()
+            recorder = self.open_snapshot_recorder(board) if self.snapshot_dir else None
+            try:
+                chunks = self.read_chunks(response, hasher, deadline, recorder)
+                if self.config.get('stream_parse', False):
+                    jobs, jobs_scanned = self.stream_jobs(chunks, job_filter)
+                else:
+                    content = b''.join(chunks)
+            finally:
+                if recorder:
+                    recorder.close()
+            content_hash = hasher.hexdigest()
+            if recorder:
+                self.commit_snapshot_recording(board)
+            
+            new_state = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'filter_hash': self.filter_hash,
+                'fetched_at': datetime.now().isoformat()
+            }
             
-            logger.info(f"Successfully fetched {len(jobs)} jobs from API")
-            return jobs
+            if content_hash == board_state.get('content_hash'):
+                logger.info(f"Board '{board}' payload identical to last fetch, skipping processing")
+                return {'outcome': 'same_content', 'fetch_state': new_state}
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch jobs from API: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse API response: {e}")
-            return None
+            if not self.config.get('stream_parse', False):
+                jobs, jobs_scanned = self.parse_jobs(content, job_filter)
+        
+        for job in jobs:
+            job['board'] = board
+        
+        logger.info(f"Fetched {jobs_scanned} jobs from board '{board}' ({len(jobs)} matching)")
+        return {'outcome': 'fetched', 'jobs': jobs, 'jobs_scanned': jobs_scanned, 'fetch_state': new_state}
     
-    def filter_san_francisco_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter jobs for San Francisco area"""
-        sf_keywords = ['san francisco', 'sf', 'bay area']
-        sf_jobs = []
+    def read_chunks(self, response: requests.Response, hasher, deadline: float,
+                    recorder=None) -> Iterator[bytes]:
+        """Yield the response body in chunks, hashing them and enforcing the run deadline
+        
+        If ``recorder`` is given each chunk is also written to it.
+        """
+        for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+            if time.monotonic() > deadline:
+                raise requests.exceptions.Timeout("Fetch deadline exceeded while reading response")
+            hasher.update(chunk)
+            if recorder:
+                recorder.write(chunk)
+            yield chunk
+    
+    def parse_jobs(self, content: bytes,
+                   job_filter: Optional[Callable[[Dict], bool]] = None) -> Tuple[List[Dict], int]:
+        """Decode a complete job board payload, returning the matching jobs and the number scanned"""
+        data = json.loads(content)
+        return self.select_jobs(data.get('jobs', []), job_filter)
+    
+    def stream_jobs(self, chunks: Iterator[bytes],
+                    job_filter: Optional[Callable[[Dict], bool]] = None) -> Tuple[List[Dict], int]:
+        """Decode jobs from a chunked body one at a time, keeping only those passing the filter
+        
+        Returns the matching jobs and the number of jobs scanned.
+        """
+        jobs, jobs_scanned = self.select_jobs(JsonArrayStream(chunks, 'jobs'), job_filter)
+        
+        # Consume anything left after the top-level object closed so it is hashed too
+        for _ in chunks:
+            pass
+        return jobs, jobs_scanned
+    
+    def select_jobs(self, jobs: Iterable[Dict],
+                    job_filter: Optional[Callable[[Dict], bool]] = None) -> Tuple[List[Dict], int]:
+        """Keep the jobs passing the filter, dropping repeated job ids, in a single pass
         
+        Returns the selected jobs and the number of jobs scanned.
+        """
+        selected = []
+        seen_ids = set()
+        jobs_scanned = 0
         for job in jobs:
-            # Check primary location
-            location = job.get('location', '').lower()
-            if any(keyword in location for keyword in sf_keywords):
-                sf_jobs.append(job)
+            jobs_scanned += 1
+            if job_filter is not None and not job_filter(job):
                 continue
             
-            # Check secondary locations
-            secondary_locations = job.get('secondaryLocations', [])
-            for sec_loc in secondary_locations:
-                sec_location = sec_loc.get('location', '').lower()
-                if any(keyword in sec_location for keyword in sf_keywords):
-                    sf_jobs.append(job)
-                    break
-            
-            # Check if job is remote (could be relevant)
-            if job.get('isRemote', False) and 'remote' in self.config.get('include_remote', []):
-                sf_jobs.append(job)
+            job_id = job_key(job)
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            selected.append(job)
+        return selected, jobs_scanned
+    
+    def start_snapshot(self):
+        """Create a timestamped directory to record this run's raw responses into"""
+        self.snapshot_dir = self.snapshots_dir / datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+    
+    def snapshot_board_file(self, board: str, snapshot_dir: Optional[Path] = None) -> Path:
+        return (snapshot_dir or self.snapshot_dir) / f"{board}.json.gz"
+    
+    def open_snapshot_recorder(self, board: str):
+        """Open a compressed file to record a board's raw response body into"""
+        part_file = self.snapshot_board_file(board).with_suffix('.part')
+        return gzip.open(part_file, 'wb', compresslevel=6)
+    
+    def commit_snapshot_recording(self, board: str):
+        """Move a completely read response into place, so retries never leave partial payloads"""
+        part_file = self.snapshot_board_file(board).with_suffix('.part')
+        part_file.replace(self.snapshot_board_file(board))
+    
+    def finish_snapshot(self, results: List[Dict]):
+        """Write the manifest for the recorded snapshot and prune old snapshots"""
+        for part_file in self.snapshot_dir.glob('*.part'):
+            part_file.unlink()
+        
+        boards = {}
+        for result in results:
+            board_file = self.snapshot_board_file(result['board'])
+            boards[result['board']] = {
+                'outcome': result['outcome'],
+                'file': board_file.name if board_file.exists() else None,
+                'fetch_state': result['fetch_state']
+            }
+        
+        if not any(entry['file'] for entry in boards.values()):
+            # Nothing was downloaded (all 304s or failures), so there is nothing to replay
+            shutil.rmtree(self.snapshot_dir, ignore_errors=True)
+            self.snapshot_dir = None
+            return
+        
+        manifest = {
+            'recorded_at': datetime.now().isoformat(),
+            'api_url': self.api_url,
+            'stream_parse': self.config.get('stream_parse', False),
+            'boards': boards
+        }
+        try:
+            with open(self.snapshot_dir / "manifest.json", 'w') as f:
+                json.dump(manifest, f, indent=2)
+            logger.info(f"Recorded snapshot to {self.snapshot_dir}")
+        except Exception as e:
+            logger.error(f"Failed to save snapshot manifest: {e}")
+        
+        keep = self.config.get('snapshot_keep', 30)
+        snapshots = sorted(path for path in self.snapshots_dir.iterdir() if path.is_dir())
+        for old_snapshot in snapshots[:-keep] if keep else []:
+            shutil.rmtree(old_snapshot, ignore_errors=True)
+        self.snapshot_dir = None
+    
+    def load_snapshot(self, snapshot_path: Path) -> Dict:
+        """Load a recorded snapshot directory, or a single ``<board>.json(.gz)`` payload file"""
+        snapshot_path = Path(snapshot_path)
+        if snapshot_path.is_dir():
+            with open(snapshot_path / "manifest.json", 'r') as f:
+                manifest = json.load(f)
+            # Boards that were unchanged or failed when recording have no payload file
+            files = {board: snapshot_path / entry['file'] if entry.get('file') else None
+                     for board, entry in manifest['boards'].items()}
+            recorded_at = datetime.fromisoformat(manifest['recorded_at'])
+        else:
+            board = snapshot_path.name.split('.')[0]
+            files = {board: snapshot_path}
+            recorded_at = datetime.fromtimestamp(snapshot_path.stat().st_mtime)
+        
+        return {'path': snapshot_path, 'recorded_at': recorded_at, 'files': files}
+    
+    def replay_board(self, board: str, job_filter: Optional[Callable[[Dict], bool]]) -> Dict:
+        """Load a board's jobs from the snapshot being replayed instead of the API"""
+        board_file = self.replay_snapshot['files'][board]
+        if board_file is None:
+            logger.info(f"Board '{board}' has no payload in snapshot, carrying forward")
+            return {'outcome': 'not_modified'}
+        
+        logger.info(f"Replaying board '{board}' from {board_file}")
+        opener = gzip.open if board_file.suffix == '.gz' else open
+        with opener(board_file, 'rb') as f:
+            if self.config.get('stream_parse', False):
+                chunks = iter(lambda: f.read(self.STREAM_CHUNK_SIZE), b'')
+                jobs, jobs_scanned = self.stream_jobs(chunks, job_filter)
+            else:
+                jobs, jobs_scanned = self.parse_jobs(f.read(), job_filter)
+        
+        for job in jobs:
+            job['board'] = board
+        
+        logger.info(f"Replayed {jobs_scanned} jobs from board '{board}' ({len(jobs)} matching)")
+        return {'outcome': 'fetched', 'jobs': jobs, 'jobs_scanned': jobs_scanned}
+    
+    def replay(self, snapshot_path: Path):
+        """Run a job check against a recorded snapshot with no network access
+        
+        The snapshot's recording time is used as the check time, so replaying
+        snapshots in order rebuilds the job lifecycle as it happened. Stored
+        validators and content hashes are dropped, so the next live run
+        fetches every board in full instead of keeping the replayed state.
+        """
+        try:
+            self.replay_snapshot = self.load_snapshot(snapshot_path)
+        except Exception as e:
+            logger.error(f"Failed to load snapshot {snapshot_path}: {e}")
+            return
+        
+        saved_boards = self.boards
+        self.boards = list(self.replay_snapshot['files'])
+        try:
+            self.run_check()
+        finally:
+            self.boards = saved_boards
+            self.replay_snapshot = None
+    
+    def match_any_profile(self, job: Dict) -> bool:
+        """Job filter used while fetching: keep a job if any profile wants it, remembering which"""
+        matched = tuple(index for index, profile in enumerate(self.profiles) if profile.job_filter(job))
+        if matched:
+            self.profile_matches[job.get('jobUrl')] = matched
+        return bool(matched)
+    
+    def split_by_profile(self, jobs: List[Dict]) -> List[List[Dict]]:
+        """Group jobs by the profiles they match, sharing the job objects between groups"""
+        profile_jobs = [[] for _ in self.profiles]
+        for job in jobs:
+            matched = self.profile_matches.get(job.get('jobUrl'))
+            if matched is None:
+                # Carried forward from a previous run, so not evaluated during this fetch
+                matched = [index for index, profile in enumerate(self.profiles) if profile.job_filter(job)]
+            for index in matched:
+                profile_jobs[index].append(job)
+        return profile_jobs
+    
+    def filter_san_francisco_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Filter jobs for San Francisco area and the configured job filter"""
+        sf_jobs, _ = self.select_jobs(jobs, self.job_filter)
         
         logger.info(f"Filtered to {len(sf_jobs)} San Francisco area jobs")
         return sf_jobs
     
+    def create_job_store(self):
+        """Pick the master database backend named by the database_backend setting"""
+        backend = self.config.get('database_backend', 'json')
+        if backend == 'sqlite':
+            return SqliteJobStore(self.master_database_file.with_suffix('.db'), self.master_database_file)
+        if backend == 'eventlog':
+            return EventLogJobStore(self.data_dir / "openai_jobs_snapshot.json",
+                                    self.data_dir / "openai_jobs_events.jsonl",
+                                    self.data_dir / "events",
+                                    self.master_database_file,
+                                    self.config.get('event_log_compact_bytes', 1024 * 1024),
+                                    self.config.get('event_log_compact_days', 7))
+        if backend != 'json':
+            logger.warning(f"Unknown database_backend '{backend}', using json")
+        return JsonJobStore(self.master_database_file)
+    
+    def migrate_database(self):
+        """Copy every profile's JSON database into its SQLite database, replacing what is there"""
+        for profile in self.profiles:
+            if not profile.master_database_file.exists():
+                logger.warning(f"No JSON database to migrate at {profile.master_database_file}")
+                continue
+            store = SqliteJobStore(profile.master_database_file.with_suffix('.db'))
+            store.migrate_from_json(profile.master_database_file)
+            # The index describes the rows just replaced
+            profile.state_index.delete()
+    
     def load_job_database(self) -> List[Dict]:
         """Load the master job database"""
-        if not self.master_database_file.exists():
-            return []
-        
-        try:
-            with open(self.master_database_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load job database: {e}")
-            return []
+        return self.job_store.load()
     
-    def save_job_database(self, jobs: List[Dict]):
-        """Save the master job database"""
+    def save_job_database(self, events: List[Dict], as_of: Optional[datetime] = None) -> bool:
+        """Save the lifecycle events (see ``job_event``) of a run to the master job database"""
         try:
-            with open(self.master_database_file, 'w') as f:
-                json.dump(jobs, f, indent=2)
-            logger.info(f"Saved {len(jobs)} jobs to database")
+            self.current_database = self.job_store.save(events, as_of or datetime.now())
+            return True
         except Exception as e:
             logger.error(f"Failed to save job database: {e}")
+            return False
+    
+    @staticmethod
+    def job_event(event_type: str, job: Dict, at: datetime, **details) -> Dict:
+        """Build an OPENED, REMAPPED, UPDATED, CLOSED or PURGED lifecycle event for a job"""
+        event = {'type': event_type, 'at': at.isoformat(), 'id': job.get('id'), 'jobUrl': job['jobUrl']}
+        event.update(details)
+        return event
+    
+    def find_remaps(self, current_jobs: Dict[str, Dict]) -> Dict[str, str]:
+        """Map the new key of each current job that changed id to its previous key, matched by jobUrl
+
+        A job is only re-keyed when nothing current still holds its previous
+        key; otherwise the new id is a separate posting at a reused URL.
+        """
+        remaps = {}
+        for key, job in current_jobs.items():
+            if key not in self.state_index.entries:
+                previous_key = self.state_index.by_url.get(job['jobUrl'])
+                if previous_key is not None and previous_key not in current_jobs:
+                    remaps[key] = previous_key
+        return remaps
     
-    def update_job_database(self, current_sf_jobs: List[Dict]) -> List[Dict]:
-        """Update the master database with job lifecycle tracking"""
-        database = self.load_job_database()
-        current_date = datetime.now()
+    def records_to_diff(self, current_jobs: Dict[str, Dict], current_hashes: Dict[str, bytes],
+                        remaps: Dict[str, str], current_date: datetime) -> List[str]:
+        """Keys of the jobs whose full records a run needs: changed, moved, re-keyed, reopened, closing or expired"""
+        remapped = set(remaps.values())
+        wanted = []
+        for key, entry in self.state_index.entries.items():
+            content_hash, status, _, _, closed_date, job_url = entry
+            if key in current_hashes:
+                if (status != 'ACTIVE' or content_hash != current_hashes[key]
+                        or job_url != current_jobs[key]['jobUrl']):
+                    wanted.append(key)
+            elif key in remapped or status == 'ACTIVE':
+                wanted.append(key)
+            elif closed_date and (current_date - JobStateIndex.from_epoch(closed_date)).days >= CLOSED_RETENTION_DAYS:
+                wanted.append(key)
+        return wanted
+    
+    def update_job_database(self, current_sf_jobs: List[Dict],
+                            current_date: Optional[datetime] = None) -> List[Dict]:
+        """Update the master database with job lifecycle tracking
+        
+        Jobs are classified by fingerprint against the state index. With a
+        store that has keyed reads, full records are only read for jobs that
+        changed, reopened, closed or are due for removal; other stores load
+        every record once and the index is rebuilt from them. A job whose
+        fingerprint is unchanged is not updated. The field-level changes of
+        edited jobs are kept in ``job_changes``.
         
-        # Create lookup of current jobs by URL
-        current_job_urls = {job['jobUrl'] for job in current_sf_jobs}
+        Jobs are tracked by job_key (their Ashby id). A job whose id changed
+        is matched to its previous record through the index's jobUrl lookup
+        and re-keyed, and a job whose URL changed keeps its record, so
+        neither shows up as one posting closing and another opening.
+        """
+        current_date = current_date or datetime.now()
+        self.current_database = None
+        self.job_changes = []
+        index = self.state_index
         
-        # Create lookup of existing jobs in database
-        db_jobs_by_url = {job['jobUrl']: job for job in database}
+        # Current jobs and their fingerprints, keyed by job_key
+        current_jobs = {job_key(job): job for job in current_sf_jobs}
+        current_hashes = {key: JobStateIndex.content_hash(job) for key, job in current_jobs.items()}
+        
+        records = None
+        upgrades = None
+        if (self.job_store.keyed_reads and self.job_store.record_version() >= self.record_version()
+                and index.load(self.job_store.revision())):
+            remaps = self.find_remaps(current_jobs)
+            wanted = self.records_to_diff(current_jobs, current_hashes, remaps, current_date)
+            records = self.job_store.get(wanted)
+            if len(records) < len(wanted):
+                logger.warning("State index is out of step with the job database - rebuilding it")
+                records = None
+        if records is None:
+            # A store without keyed reads, the first run with an index, or an index out of step
+            database = self.load_job_database()
+            upgrades = self.upgrade_records(database, current_date)
+            index.rebuild(database)
+            db_jobs_by_key = {job_key(job): job for job in database}
+            remaps = self.find_remaps(current_jobs)
+            records = {key: db_jobs_by_key[key]
+                       for key in self.records_to_diff(current_jobs, current_hashes, remaps, current_date)}
         
         new_jobs = []
-        updated_database = []
+        
+        # Lifecycle events for everything that changed in this run, and edited descriptions
+        events = list(upgrades or [])
+        revisions = []
         
         # Process current jobs from API
-        for job in current_sf_jobs:
-            job_url = job['jobUrl']
+        now = JobStateIndex.to_epoch(current_date.isoformat())
+        for key, job in current_jobs.items():
+            if key in remaps:
+                # Same posting under a new id - move its record before comparing it
+                previous_key = remaps[key]
+                existing_job = records.pop(previous_key)
+                events.append(self.job_event('REMAPPED', job, current_date, previous_key=previous_key))
+                records[key] = dict(existing_job, id=job['id'])
+                index.rekey(previous_key, key, job['jobUrl'])
+                logger.info(f"Job re-keyed: {job['title']} ({previous_key} -> {key})")
             
-            if job_url in db_jobs_by_url:
-                # Existing job - update it
-                existing_job = db_jobs_by_url[job_url]
-                existing_job.update(job)  # Update with latest data
-                existing_job['status'] = 'ACTIVE'
-                existing_job['last_seen'] = current_date.isoformat()
-                
-                # Calculate days since first listed
-                first_seen = datetime.fromisoformat(existing_job['first_seen'])
-                existing_job['days_since_listed'] = (current_date - first_seen).days
-                
-                updated_database.append(existing_job)
-            else:
-                # New job
+            entry = index.entries.get(key)
+            if entry is None:
+                # New job - copied, as the fetched job may be shared with other profiles
+                job = dict(job)
                 job['status'] = 'ACTIVE'
                 job['first_seen'] = current_date.isoformat()
-                job['last_seen'] = current_date.isoformat()
-                job['days_since_listed'] = 0
-                updated_database.append(job)
+                job.update(parse_compensation(job.get('compensation'))['fields'])
+                refresh_lifecycle_fields(job, current_date)
                 new_jobs.append(job)
+                events.append(self.job_event('OPENED', job, current_date, record=job))
+                index.set(job, current_hashes[key])
+                continue
+            
+            if key in records:
+                # Existing job that changed, moved or reopened - record what differs
+                existing_job = records[key]
+                if existing_job['jobUrl'] != job['jobUrl']:
+                    logger.info(f"Job moved: {job['title']} ({existing_job['jobUrl']} -> {job['jobUrl']})")
+                    index.rekey(key, key, job['jobUrl'])
+                fields = {field: value for field, value in job.items() if existing_job.get(field) != value}
+                if existing_job['status'] != 'ACTIVE':
+                    fields['status'] = 'ACTIVE'
+                removed = [field for field in existing_job if field not in job
+                           and field not in LIFECYCLE_FIELDS and field not in COMPENSATION_FIELDS]
+                if 'compensation' in fields or 'compensation' in removed:
+                    fields.update({field: value for field, value in
+                                   parse_compensation(job.get('compensation'))['fields'].items()
+                                   if field not in existing_job or existing_job[field] != value})
+                details = {'fields': fields}
+                if removed:
+                    details['removed'] = removed
+                
+                old_fields = fingerprint_fields(existing_job)
+                new_fields = fingerprint_fields(job)
+                changes = {field: {'old': old_fields[field], 'new': new_fields[field]}
+                           for field in new_fields if old_fields[field] != new_fields[field]}
+                if changes:
+                    details['changes'] = changes
+                    if 'description' in changes and self.descriptions:
+                        revisions.append((key, job['jobUrl'], current_date.isoformat(),
+                                          changes['description']['old'], changes['description']['new'],
+                                          existing_job.get('first_seen')))
+                    updated_job = dict(existing_job, **fields)
+                    for field in removed:
+                        del updated_job[field]
+                    self.job_changes.append({'job': updated_job, 'changes': changes})
+                    logger.info(f"Job updated: {job['title']} ({', '.join(changes)} changed)")
+                
+                if fields or removed:
+                    events.append(self.job_event('UPDATED', existing_job, current_date, **details))
+                entry[0] = current_hashes[key]
+                entry[1] = 'ACTIVE'
+            entry[3] = now
         
         # Process existing jobs that are no longer current (mark as CLOSED)
-        for job in database:
-            if job['jobUrl'] not in current_job_urls:
-                if job['status'] == 'ACTIVE':
-                    # Just became closed
-                    job['status'] = 'CLOSED'
-                    job['closed_date'] = current_date.isoformat()
-                    logger.info(f"Job closed: {job['title']}")
-                
-                # Calculate days until deletion for closed jobs
-                if job['status'] == 'CLOSED':
-                    closed_date = datetime.fromisoformat(job['closed_date'])
-                    days_closed = (current_date - closed_date).days
-                    job['days_until_deletion'] = max(0, 5 - days_closed)
-                    
-                    # Only keep if within 5-day window
-                    if days_closed < 5:
-                        # Calculate days since first listed
-                        first_seen = datetime.fromisoformat(job['first_seen'])
-                        job['days_since_listed'] = (closed_date - first_seen).days
-                        updated_database.append(job)
-                    else:
-                        logger.info(f"Job deleted: {job['title']} (closed for 5 days)")
+        expired = []
+        for key in [key for key in records if key not in current_hashes]:
+            job = records[key]
+            entry = index.entries[key]
+            if entry[1] == 'ACTIVE':
+                # Just became closed
+                events.append(self.job_event('CLOSED', job, current_date, last_seen=job.get('last_seen')))
+                entry[1] = 'CLOSED'
+                entry[4] = now
+                logger.info(f"Job closed: {job['title']}")
+            else:
+                # Closed for the whole retention window
+                events.append(self.job_event('PURGED', job, current_date))
+                index.remove(key)
+                expired.append(job)
+        
+        if expired:
+            self.archive_expired_jobs(expired, current_date)
         
-        self.save_job_database(updated_database)
+        if self.save_job_database(events, current_date):
+            if self.job_store.keyed_reads:
+                index.save(self.job_store.revision())
+                if upgrades is not None:
+                    self.job_store.set_record_version(self.record_version())
+            if revisions:
+                self.descriptions.record_revisions(revisions)
+        else:
+            # Rebuilt from the database on the next run
+            index.delete()
         return new_jobs
     
+    def record_version(self) -> int:
+        """The record version this monitor's settings call for"""
+        return self.RECORD_EXTERNAL_DESCRIPTIONS if self.descriptions else self.RECORD_COMPENSATION_FIELDS
+    
+    def upgrade_records(self, jobs: List[Dict], at: datetime) -> List[Dict]:
+        """Bring records saved by earlier versions up to date, returning UPDATED events for the changes
+        
+        Runs on every full load, so stores without keyed reads are checked
+        each run; SQLite notes the record version it has been upgraded to and
+        is only scanned again when that is behind. Records are updated in
+        place, so the run's diff already sees the upgraded fields.
+        """
+        events = []
+        for job in jobs:
+            fields = {}
+            removed = []
+            # Typed compensation fields, stored since they became part of the record
+            if any(field not in job for field in COMPENSATION_FIELDS):
+                fields.update(parse_compensation(job.get('compensation'))['fields'])
+            # Descriptions saved inline before the description store, moved into it
+            if self.descriptions and any(field in job for field in DescriptionStore.FIELDS):
+                externalized = {field: job[field] for field in DescriptionStore.FIELDS if field in job}
+                externalized['description_blobs'] = dict(job.get('description_blobs') or {})
+                self.descriptions.externalize(externalized)
+                fields['description_blobs'] = externalized['description_blobs']
+                removed = [field for field in DescriptionStore.FIELDS if field in job]
+            if fields:
+                job.update(fields)
+                for field in removed:
+                    del job[field]
+                details = {'fields': fields, 'removed': removed} if removed else {'fields': fields}
+                events.append(self.job_event('UPDATED', job, at, **details))
+        if events:
+            logger.info(f"Upgraded {len(events)} stored job records")
+        return events
+    
+    def archive_expired_jobs(self, jobs: List[Dict], current_date: datetime):
+        """Move jobs closed for the whole retention window out of the master database
+        
+        They are archived before the database drops them, so a failed save
+        can at worst archive a job twice, never lose it.
+        """
+        for job in jobs:
+            refresh_lifecycle_fields(job, current_date)
+        
+        if not self.archive:
+            for job in jobs:
+                logger.info(f"Job deleted: {job['title']} (closed for {CLOSED_RETENTION_DAYS} days)")
+            return
+        
+        try:
+            self.archive.append(jobs, current_date)
+            for job in jobs:
+                logger.info(f"Job archived: {job['title']} (closed for {CLOSED_RETENTION_DAYS} days)")
+        except Exception as e:
+            logger.error(f"Failed to archive closed jobs: {e}")
+    
+    def show_archived_jobs(self, since: Optional[str] = None, until: Optional[str] = None):
+        """Print archived jobs that closed between two YYYY-MM months"""
+        if not self.archive:
+            print("The closed job archive is disabled (archive_closed_jobs)")
+            return
+        
+        count = 0
+        for job in self.archive.iter_jobs(since, until):
+            count += 1
+            print(f"{job['closed_date'][:10]}  {job['title']}  [{job.get('department', 'N/A')}]  {job['jobUrl']}")
+        print(f"{count} archived job(s)")
+    
     def extract_compensation(self, job: Dict) -> Dict:
         """Extract and format compensation data from job posting"""
-        compensation_info = {
-            'salary_summary': '',
-            'salary_range': '',
-            'salary_min': '',
-            'salary_max': '',
-            'equity': '',
-            'bonus': '',
-            'full_compensation': ''
-        }
+        display = parse_compensation(job.get('compensation'))['display']
+        return dict(display, full_compensation=self.normalize_text(display['full_compensation']))
+    
+    def find_compensation_changes(self) -> List[Dict]:
+        """Jobs from the last update whose salary or equity bounds moved
         
-        compensation = job.get('compensation', {})
-        
-        # Check if compensation data exists
-        if not compensation or not compensation.get('compensationTierSummary'):
-            return compensation_info
-        
-        try:
-            # Get human-readable summaries directly from API - fix encoding issues
-            full_comp_raw = compensation.get('compensationTierSummary', '')
-            # Fix UTF-8 encoding issues - replace problematic characters
-            compensation_info['full_compensation'] = (full_comp_raw
-                .replace('–', '-')           # em dash to hyphen
-                .replace('—', '-')           # en dash to hyphen  
-                .replace('•', '•')           # bullet point
-                .replace('\u2013', '-')     # unicode en dash
-                .replace('\u2014', '-')     # unicode em dash
-                .replace('\u2022', '•')     # unicode bullet
-                .encode('ascii', 'ignore').decode('ascii'))  # remove any remaining non-ASCII
-            compensation_info['salary_range'] = compensation.get('scrapeableCompensationSalarySummary', '')
-            
-            # Parse detailed compensation components for more granular data
-            summary_components = compensation.get('summaryComponents', [])
-            for component in summary_components:
-                comp_type = component.get('compensationType', '')
-                min_val = component.get('minValue')
-                max_val = component.get('maxValue')
-                currency = component.get('currencyCode', 'USD')
-                
-                if comp_type == 'Salary':
-                    if min_val and max_val:
-                        # Salary range
-                        compensation_info['salary_summary'] = f"${min_val:,.0f} - ${max_val:,.0f} {currency}"
-                        compensation_info['salary_min'] = str(int(min_val))
-                        compensation_info['salary_max'] = str(int(max_val))
-                    elif min_val and not max_val:
-                        # Single salary value - put in both min and max
-                        compensation_info['salary_summary'] = f"${min_val:,.0f} {currency}"
-                        compensation_info['salary_min'] = str(int(min_val))
-                        compensation_info['salary_max'] = str(int(min_val))
-                    elif max_val and not min_val:
-                        # Only max value (rare case)
-                        compensation_info['salary_summary'] = f"Up to ${max_val:,.0f} {currency}"
-                        compensation_info['salary_min'] = str(int(max_val))
-                        compensation_info['salary_max'] = str(int(max_val))
-                elif comp_type == 'EquityPercentage' and min_val and max_val:
-                    compensation_info['equity'] = f"{min_val}% - {max_val}%"
-                elif comp_type == 'EquityCashValue':
-                    compensation_info['equity'] = 'Offered'
-                elif comp_type == 'Bonus':
-                    compensation_info['bonus'] = 'Yes' if min_val or max_val else 'Offered'
-            
-            return compensation_info
-            
+        Only jobs whose fingerprint diff names compensation are looked at,
+        so unchanged postings are never parsed.
+        """
+        compensation_changes = []
+        for change in self.job_changes:
+            if 'compensation' not in change['changes']:
+                continue
+            old = parse_compensation(change['changes']['compensation']['old'])
+            new = parse_compensation(change['changes']['compensation']['new'])
+            if old['bands'] != new['bands']:
+                compensation_changes.append({'job': change['job'], 'old': old, 'new': new})
+        return compensation_changes
+    
+    @staticmethod
+    def format_bands(compensation: Dict) -> Tuple[str, str]:
+        """Human-readable salary and equity ranges of a parse_compensation result"""
+        salary_min, salary_max = compensation['bands'][:2]
+        if salary_min is None:
+            salary = 'none'
+        elif salary_min == salary_max:
+            salary = f"${salary_min:,.0f}"
+        else:
+            salary = f"${salary_min:,.0f} - ${salary_max:,.0f}"
+        # Equity reads as it does everywhere else - a percentage range, or 'Offered' for a cash value
+        return salary, compensation['display']['equity'] or 'none'
+    
+    def generate_compensation_report(self, compensation_changes: List[Dict]) -> str:
+        """Generate the report section listing postings whose compensation changed"""
+        report_lines = [
+            f"💰 COMPENSATION CHANGES - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"{'='*60}",
+            f"{len(compensation_changes)} existing job(s) in {self.label} area changed compensation:",
+            ""
+        ]
+        
+        for i, change in enumerate(compensation_changes, 1):
+            job = change['job']
+            old_salary, old_equity = self.format_bands(change['old'])
+            new_salary, new_equity = self.format_bands(change['new'])
+            report_lines.append(f"{i}. {job['title']}")
+            if old_salary != new_salary:
+                report_lines.append(f"   💵 Salary: {old_salary} -> {new_salary}")
+            if old_equity != new_equity:
+                report_lines.append(f"   📈 Equity: {old_equity} -> {new_equity}")
+            report_lines.extend([
+                f"   🏢 Department: {job.get('department', 'N/A')}",
+                f"   📋 Details: {job['jobUrl']}",
+                ""
+            ])
+        
+        return "\n".join(report_lines)
+    
+    def find_description_history(self, job_ref: str) -> Optional[Tuple[str, List[Dict]]]:
+        """Look up a job's description revisions by jobUrl, Ashby id or a unique part of the URL"""
+        if not self.descriptions:
+            print("Description history needs externalize_descriptions to be enabled")
+            return None
+        
+        history = self.descriptions.load_history()
+        if job_ref in history:
+            matches = [job_ref]
+        else:
+            # Histories are keyed by job_key; each revision notes the jobUrl it was seen at
+            matches = [key for key, revisions in history.items()
+                       if job_ref in key or any(job_ref in revision.get('jobUrl', '') for revision in revisions)]
+        if len(matches) != 1:
+            print(f"No description history for '{job_ref}'" if not matches
+                  else f"'{job_ref}' matches {len(matches)} jobs - use the full job URL")
+            return None
+        revisions = history[matches[0]]
+        return revisions[-1].get('jobUrl', matches[0]), revisions
+    
+    def show_description_history(self, job_ref: str, field: str = 'descriptionPlain'):
+        """Print the recorded revisions of a job's description"""
+        found = self.find_description_history(job_ref)
+        if not found:
+            return
+        job_url, revisions = found
+        
+        print(f"Description history for {job_url} ({len(revisions)} revisions)")
+        for number, revision in enumerate(revisions, 1):
+            digest = revision.get(field)
+            text = self.descriptions.get(digest) if digest else None
+            length = f"{len(text):,} chars" if text is not None else 'no text'
+            print(f"  {number}. {revision.get('at') or 'unknown'}  {length}  {(digest or '-')[:12]}")
+    
+    def show_description_diff(self, job_ref: str, from_revision: int, to_revision: int,
+                              field: str = 'descriptionPlain'):
+        """Print a unified diff between two revisions of a job's description, numbered from 1"""
+        found = self.find_description_history(job_ref)
+        if not found:
+            return
+        job_url, revisions = found
+        
+        texts = []
+        for number in (from_revision, to_revision):
+            if not 1 <= number <= len(revisions):
+                print(f"Revision {number} does not exist - {job_url} has {len(revisions)}")
+                return
+            digest = revisions[number - 1].get(field)
+            texts.append((self.descriptions.get(digest) or '') if digest else '')
+        
+        diff = difflib.unified_diff(
+            texts[0].splitlines(), texts[1].splitlines(),
+            fromfile=f"revision {from_revision} ({revisions[from_revision - 1].get('at')})",
+            tofile=f"revision {to_revision} ({revisions[to_revision - 1].get('at')})",
+            lineterm=''
+        )
+        print('\n'.join(diff) or "No differences")
+    
+    def load_current_jobs(self) -> List[Dict]:
+        """Load the jobs saved by the last completed check"""
+        if not self.current_jobs_file.exists():
+            return []
+        
+        try:
+            with open(self.current_jobs_file, 'r') as f:
+                return json.load(f)
         except Exception as e:
-            logger.error(f"ERROR in extract_compensation for {job.get('title')}: {e}")
-            return compensation_info
+            logger.error(f"Failed to load current jobs: {e}")
+            return []
     
     def save_current_jobs(self, jobs: List[Dict]):
         """Save current job state for backup"""
@@ -256,29 +2465,48 @@ class OpenAIJobMonitor:
         except Exception as e:
             logger.error(f"Failed to save current jobs: {e}")
     
-    def generate_report(self, new_jobs: List[Dict]) -> str:
-        """Generate a human-readable report of new jobs"""
-        if not new_jobs:
-            return "No new OpenAI jobs found in San Francisco area."
+    def generate_report(self, new_jobs: List[JobRecord], compensation_changes: Optional[List[Dict]] = None) -> str:
+        """Generate a human-readable report of new jobs, followed by any compensation changes, and save it"""
+        report = self.format_report(new_jobs, compensation_changes)
         
-        report_lines = [
-            f"🚀 NEW OPENAI JOBS REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"{'='*60}",
-            f"Found {len(new_jobs)} new job(s) in San Francisco area:",
-            ""
-        ]
+        # Save report to file
+        try:
+            with open(self.report_file, 'w') as f:
+                f.write(report)
+            logger.info(f"Report saved to {self.report_file}")
+        except Exception as e:
+            logger.error(f"Failed to save report: {e}")
+        
+        return report
+    
+    def format_report(self, new_jobs: List[JobRecord], compensation_changes: Optional[List[Dict]] = None) -> str:
+        """Human-readable report of new jobs, followed by any compensation changes"""
+        if not new_jobs and not compensation_changes:
+            return f"No new OpenAI jobs found in {self.label} area."
+        
+        if new_jobs:
+            report_lines = [
+                f"🚀 NEW OPENAI JOBS REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"{'='*60}",
+                f"Found {len(new_jobs)} new job(s) in {self.label} area:",
+                ""
+            ]
+        else:
+            report_lines = [f"No new OpenAI jobs found in {self.label} area.", ""]
+        
+        annual_salaries = self.salary_normalizer.annualize(
+            [(job.salary_min, job.salary_max, job.currency, job.interval) for job in new_jobs])
         
         for i, job in enumerate(new_jobs, 1):
-            published_date = datetime.fromisoformat(job['publishedAt'].replace('Z', '+00:00'))
-            compensation = self.extract_compensation(job)
+            compensation = self.extract_compensation(job.fields)
             
             report_lines.extend([
-                f"{i}. {job['title']}",
-                f"   📍 Location: {job['location']}",
-                f"   🏢 Department: {job.get('department', 'N/A')}",
-                f"   👥 Team: {job.get('team', 'N/A')}",
-                f"   📅 Published: {published_date.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"   🌐 Remote: {'Yes' if job.get('isRemote') else 'No'}",
+                f"{i}. {job.title}",
+                f"   📍 Location: {job.location}",
+                f"   🏢 Department: {job.department or 'N/A'}",
+                f"   👥 Team: {job.team or 'N/A'}",
+                f"   📅 Published: {job.timestamp('published_at').strftime('%Y-%m-%d %H:%M:%S')}",
+                f"   🌐 Remote: {'Yes' if job.is_remote else 'No'}",
             ])
             
             # Add compensation info if available
@@ -286,32 +2514,30 @@ class OpenAIJobMonitor:
                 report_lines.append(f"   💰 Compensation: {compensation['full_compensation']}")
             elif compensation['salary_range']:
                 report_lines.append(f"   💰 Salary: {compensation['salary_range']}")
+            annual_min, annual_max = annual_salaries[i - 1]
+            if (annual_min is not None and annual_max is not None
+                    and self.salary_normalizer.converts(job.currency, job.interval)):
+                report_lines.append(f"   💱 Annualized: {annual_min:,.0f} - {annual_max:,.0f} "
+                                    f"{self.salary_normalizer.reference_currency}")
             
             report_lines.extend([
-                f"   🔗 Apply: {job['applyUrl']}",
-                f"   📋 Details: {job['jobUrl']}",
+                f"   🔗 Apply: {job.fields['applyUrl']}",
+                f"   📋 Details: {job.job_url}",
                 ""
             ])
             
             # Add secondary locations if any
-            if job.get('secondaryLocations'):
-                secondary_locs = [loc['location'] for loc in job['secondaryLocations']]
+            if job.fields.get('secondaryLocations'):
+                secondary_locs = [loc['location'] for loc in job.fields['secondaryLocations']]
                 report_lines.append(f"   📍 Also available in: {', '.join(secondary_locs)}")
                 report_lines.append("")
         
-        report = "\n".join(report_lines)
-        
-        # Save report to file
-        try:
-            with open(self.report_file, 'w') as f:
-                f.write(report)
-            logger.info(f"Report saved to {self.report_file}")
-        except Exception as e:
-            logger.error(f"Failed to save report: {e}")
+        if compensation_changes:
+            report_lines.append(self.generate_compensation_report(compensation_changes))
         
-        return report
+        return "\n".join(report_lines)
     
-    def save_to_csv(self, jobs: List[Dict]):
+    def save_to_csv(self, jobs: List[JobRecord]):
         """Save jobs data to CSV format"""
         if not jobs:
             logger.info("No jobs to save to CSV")
@@ -332,90 +2558,63 @@ class OpenAIJobMonitor:
                 # Data rows
                 for i, job in enumerate(jobs):
                     try:
-                        published_date = datetime.fromisoformat(job['publishedAt'].replace('Z', '+00:00'))
-                        
-                        # Initialize compensation data with all required keys
-                        comp = {
-                            'salary_range': '',
-                            'salary_min': '',
-                            'salary_max': '', 
-                            'full_compensation': '',
-                            'equity': '',
-                            'bonus': ''
-                        }
-                        
-                        # Extract compensation if available
-                        compensation_data = job.get('compensation', {})
-                        if compensation_data and compensation_data.get('compensationTierSummary'):
-                            full_comp_raw = compensation_data.get('compensationTierSummary', '')
-                            comp['full_compensation'] = (full_comp_raw
-                                .replace('–', '-')           # em dash to hyphen
-                                .replace('—', '-')           # en dash to hyphen  
-                                .replace('•', '•')           # bullet point
-                                .replace('\u2013', '-')     # unicode en dash
-                                .replace('\u2014', '-')     # unicode em dash
-                                .replace('\u2022', '•')     # unicode bullet
-                                .encode('ascii', 'ignore').decode('ascii'))
-                            comp['salary_range'] = compensation_data.get('scrapeableCompensationSalarySummary', '')
-                            
-                            # Parse salary components
-                            summary_components = compensation_data.get('summaryComponents', [])
-                            for component in summary_components:
-                                if component.get('compensationType') == 'Salary':
-                                    min_val = component.get('minValue')
-                                    max_val = component.get('maxValue')
-                                    if min_val:
-                                        comp['salary_min'] = str(int(min_val))
-                                    if max_val:
-                                        comp['salary_max'] = str(int(max_val))
-                                    # If only one value, use it for both min and max
-                                    if min_val and not max_val:
-                                        comp['salary_max'] = str(int(min_val))
-                                    elif max_val and not min_val:
-                                        comp['salary_min'] = str(int(max_val))
-                                elif component.get('compensationType') == 'EquityCashValue':
-                                    comp['equity'] = 'Offered'
+                        comp = self.extract_compensation(job.fields)
                         
                         writer.writerow([
-                            job['title'],
-                            job['location'],
-                            job.get('department', ''),
-                            job.get('team', ''),
-                            published_date.strftime('%Y-%m-%d %H:%M:%S'),
-                            'Yes' if job.get('isRemote') else 'No',
-                            job.get('employmentType', ''),
+                            job.title,
+                            job.location,
+                            job.department or '',
+                            job.team or '',
+                            job.timestamp('published_at').strftime('%Y-%m-%d %H:%M:%S'),
+                            'Yes' if job.is_remote else 'No',
+                            job.employment_type or '',
                             comp['salary_range'],
                             comp['salary_min'],
                             comp['salary_max'],
                             comp['full_compensation'],
                             comp['equity'],
                             comp['bonus'],
-                            job['applyUrl'],
-                            job['jobUrl']
+                            job.fields['applyUrl'],
+                            job.job_url
                         ])
                     except Exception as e:
-                        logger.error(f"Error processing job {i+1} ({job.get('title', 'Unknown')}): {e}")
+                        logger.error(f"Error processing job {i+1} ({job.title or 'Unknown'}): {e}")
                         continue
             
             logger.info(f"CSV data saved to {self.csv_file}")
         except Exception as e:
             logger.error(f"Failed to save CSV: {e}")
     
-    def send_email_notification(self, report: str, new_jobs: List[Dict]):
+    def send_email_notification(self, report: str, new_jobs: List[JobRecord]):
         """Send email notification if new jobs found"""
         if not new_jobs or not self.config.get('email_enabled'):
             return
         
+        subject = f"🚀 {len(new_jobs)} New OpenAI Job(s) in {self.label} - {datetime.now().strftime('%Y-%m-%d')}"
+        self.send_email(subject, report, attach_csv=True)
+    
+    def send_compensation_notification(self, compensation_report: str, compensation_changes: List[Dict]):
+        """Send a separate email when existing postings changed their compensation"""
+        if (not compensation_changes or not self.config.get('email_enabled')
+                or not self.config.get('notify_compensation_changes', True)):
+            return
+        
+        subject = (f"💰 {len(compensation_changes)} OpenAI Job Compensation Change(s) in {self.label}"
+                   f" - {datetime.now().strftime('%Y-%m-%d')}")
+        self.send_email(subject, compensation_report)
+    
+    def send_email(self, subject: str, body: str, attach_csv: bool = False):
+        """Send a plain-text email to the configured recipient"""
         try:
             msg = MIMEMultipart()
             msg['From'] = self.config['email_from']
             msg['To'] = self.config['email_to']
-            msg['Subject'] = f"🚀 {len(new_jobs)} New OpenAI Job(s) in San Francisco - {datetime.now().strftime('%Y-%m-%d')}"
+            msg['Subject'] = subject
             
-            msg.attach(MIMEText(report, 'plain'))
+            msg.attach(MIMEText(body, 'plain'))
             
             # Attach CSV if requested
-            if self.config.get('attach_csv') and self.csv_file.exists():
+            if attach_csv and self.config.get('attach_csv') and self.csv_file.exists():
                 with open(self.csv_file, 'r') as f:
                     attachment = MIMEText(f.read(), 'csv')
                     attachment.add_header('Content-Disposition', 'attachment', filename=self.csv_file.name)
@@ -428,16 +2627,85 @@ class OpenAIJobMonitor:
             server.send_message(msg)
             server.quit()
             
-            logger.info("Email notification sent successfully")
+            logger.info(f"Email notification sent successfully: {subject}")
             
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
     
-    def generate_dashboard_data(self):
+    def with_annual_salaries(self, jobs: List[Dict]) -> List[Dict]:
+        """Copies of the jobs with ``salary_annual_min``/``salary_annual_max`` in the reference currency"""
+        salaries = []
+        for job in jobs:
+            # Records saved before compensation was stored as numbers are parsed instead
+            fields = job if 'currency' in job else parse_compensation(job.get('compensation'))['fields']
+            salaries.append((fields.get('salary_min'), fields.get('salary_max'),
+                             fields.get('currency'), fields.get('interval')))
+        return [dict(job, salary_annual_min=annual_min, salary_annual_max=annual_max)
+                for job, (annual_min, annual_max) in zip(jobs, self.salary_normalizer.annualize(salaries))]
+    
+    @staticmethod
+    def salary_percentiles(values: List[float]) -> Optional[Dict]:
+        """p10, p50 and p90 of a list of salaries, or None if it is empty"""
+        if not values:
+            return None
+        if len(values) == 1:
+            return dict.fromkeys(('p10', 'p50', 'p90'), round(values[0]))
+        deciles = statistics.quantiles(values, n=10, method='inclusive')
+        return {'p10': round(deciles[0]), 'p50': round(deciles[4]), 'p90': round(deciles[8])}
+    
+    def compensation_analytics(self, database: List[Dict], as_of: datetime) -> Dict:
+        """Salary percentiles, job counts and posted/closed rates per department and per team
+        
+        Salaries are the annualized ones from ``with_annual_salaries``, so
+        groups mixing currencies and pay intervals compare like for like.
+        Rates cover the closed-job retention window, as closed jobs leave
+        the database after it.
+        """
+        window_start = to_epoch_us(as_of - timedelta(days=CLOSED_RETENTION_DAYS))
+        groups = {'departments': {}, 'teams': {}}
+        
+        # One pass gathers each group's salaries and counts
+        for job in database:
+            active = job['status'] == 'ACTIVE'
+            posted = timestamp_us(job['first_seen']) >= window_start
+            closed = not active and timestamp_us(job['closed_date']) >= window_start
+            for kind, name in (('departments', job.get('department')), ('teams', job.get('team'))):
+                group = groups[kind].setdefault(name or 'Unknown', {
+                    'active': 0, 'posted': 0, 'closed': 0, 'salary_min': [], 'salary_max': []})
+                group['posted'] += posted
+                group['closed'] += closed
+                if active:
+                    group['active'] += 1
+                    if job.get('salary_annual_min') is not None:
+                        group['salary_min'].append(job['salary_annual_min'])
+                    if job.get('salary_annual_max') is not None:
+                        group['salary_max'].append(job['salary_annual_max'])
+        
+        analytics = {
+            'currency': self.salary_normalizer.reference_currency,
+            'window_days': CLOSED_RETENTION_DAYS
+        }
+        for kind, by_name in groups.items():
+            analytics[kind] = {
+                name: {
+                    'active': group['active'],
+                    'with_salary': len(group['salary_min']),
+                    'salary_min': self.salary_percentiles(group['salary_min']),
+                    'salary_max': self.salary_percentiles(group['salary_max']),
+                    'posted_per_day': round(group['posted'] / CLOSED_RETENTION_DAYS, 2),
+                    'closed_per_day': round(group['closed'] / CLOSED_RETENTION_DAYS, 2)
+                }
+                for name, group in sorted(by_name.items())
+            }
+        return analytics
+    
+    def generate_dashboard_data(self, database: Optional[List[Dict]] = None, as_of: Optional[datetime] = None):
         """Generate JSON data file for the web dashboard"""
-        database = self.load_job_database()
+        if database is None:
+            database = self.load_job_database()
         
-        # Separate active and closed jobs for dashboard
+        # Separate active and closed jobs for dashboard, with salaries on one comparable yearly scale
+        database = self.with_annual_salaries(database)
         active_jobs = [job for job in database if job['status'] == 'ACTIVE']
         closed_jobs = [job for job in database if job['status'] == 'CLOSED']
         
@@ -449,7 +2717,7 @@ class OpenAIJobMonitor:
                 'total_active': len(active_jobs),
                 'total_closed': len(closed_jobs),
                 'departments': list(set(job.get('department', 'Unknown') for job in active_jobs)),
-                'salary_ranges': [self.extract_compensation(job) for job in active_jobs if job.get('compensation')]
+                'compensation': self.compensation_analytics(database, as_of or datetime.now())
             }
         }
         
@@ -462,36 +2730,96 @@ class OpenAIJobMonitor:
         except Exception as e:
             logger.error(f"Failed to save dashboard data: {e}")
     
-    def run_check(self):
-        """Main method to run a job check"""
-        logger.info("Starting OpenAI job check...")
-        
-        # Fetch current jobs
-        all_jobs = self.fetch_jobs()
-        if all_jobs is None:
-            logger.error("Failed to fetch jobs, aborting check")
-            return
-        
-        # Filter for San Francisco
-        sf_jobs = self.filter_san_francisco_jobs(all_jobs)
+    def process_jobs(self, jobs: List[Dict], check_time: Optional[datetime] = None,
+                     end_stage: Optional[Callable[[str], None]] = None) -> List[Dict]:
+        """Run the lifecycle, report, dashboard and notification stages over this profile's jobs"""
+        end_stage = end_stage or (lambda stage: None)
+        prefix = f"{self.profile_name}." if self.profile_name else ''
         
         # Update database and identify new jobs
-        new_jobs = self.update_job_database(sf_jobs)
+        new_jobs = self.update_job_database(jobs, check_time)
+        end_stage(prefix + 'database')
         
-        # Generate report for new jobs only
-        report = self.generate_report(new_jobs)
+        # Generate report for new jobs and compensation changes - records are parsed once for every stage
+        new_records = [JobRecord.from_dict(job) for job in new_jobs]
+        compensation_changes = self.find_compensation_changes()
+        self.compensation_changes = compensation_changes
+        report = self.generate_report(new_records, compensation_changes)
         print(report)
         
         # Generate dashboard data export
-        self.generate_dashboard_data()
+        self.generate_dashboard_data(self.current_database, check_time)
+        end_stage(prefix + 'dashboard')
         
         # Save data and send notifications
         if new_jobs:
-            self.save_to_csv(new_jobs)
-            self.send_email_notification(report, new_jobs)
+            self.save_to_csv(new_records)
+            # Compensation changes go out in their own email below, so the new-jobs email leaves them off
+            self.send_email_notification(self.format_report(new_records) if compensation_changes else report,
+                                         new_records)
+        if compensation_changes:
+            self.send_compensation_notification(self.generate_compensation_report(compensation_changes),
+                                                compensation_changes)
         
         # Always save current state for backup
-        self.save_current_jobs(sf_jobs)
+        self.save_current_jobs(jobs)
+        end_stage(prefix + 'outputs')
+        
+        return new_jobs
+    
+    def run_check(self):
+        """Main method to run a job check"""
+        logger.info("Starting OpenAI job check...")
+        started_at = datetime.now()
+        
+        stage_seconds = {}
+        stage_start = time.perf_counter()
+        
+        def end_stage(stage: str):
+            nonlocal stage_start
+            stage_seconds[stage] = round(time.perf_counter() - stage_start, 3)
+            stage_start = time.perf_counter()
+        
+        # Fetch current jobs matching any profile's filters (San Francisco by default)
+        jobs = self.fetch_jobs(job_filter=self.match_any_profile)
+        end_stage('fetch')
+        if jobs is None:
+            logger.error("Failed to fetch jobs, aborting check")
+            self.save_fetch_state()
+            self.record_run('fetch_failed', started_at, boards=self.board_outcomes, stage_seconds=stage_seconds)
+            return
+        
+        if self.board_unchanged:
+            logger.info("No changes on job board, skipping database and dashboard update")
+            self.save_fetch_state()
+            self.record_run(self.fetch_outcome, started_at, boards=self.board_outcomes, stage_seconds=stage_seconds)
+            return
+        
+        check_time = self.replay_snapshot['recorded_at'] if self.replay_snapshot else None
+        profile_counts = {}
+        for profile, profile_jobs in zip(self.profiles, self.split_by_profile(jobs)):
+            new_jobs = profile.process_jobs(profile_jobs, check_time, end_stage)
+            profile_counts[profile.profile_name] = {'matched': len(profile_jobs), 'new': len(new_jobs),
+                                                    'updated': len(profile.job_changes),
+                                                    'compensation_changed': len(profile.compensation_changes)}
+        
+        if self.profiles != [self]:
+            # Keep every profile's jobs together so unchanged boards can be carried forward
+            self.save_current_jobs(jobs)
+        
+        # Only remember validators once the run has been fully processed
+        self.save_fetch_state()
+        details = {
+            'jobs_fetched': self.jobs_scanned,
+            'jobs_matched': len(jobs),
+            'new_jobs': sum(counts['new'] for counts in profile_counts.values()),
+            'updated_jobs': sum(counts['updated'] for counts in profile_counts.values()),
+            'compensation_changes': sum(counts['compensation_changed'] for counts in profile_counts.values()),
+        }
+        if self.profiles != [self]:
+            details['profiles'] = profile_counts
+        self.record_run(self.fetch_outcome, started_at, boards=self.board_outcomes,
+                        stage_seconds=stage_seconds, **details)
         
         logger.info("Job check completed")
     
@@ -518,7 +2846,34 @@ def load_config(config_file: str = "config.json") -> Dict:
         "check_time": "09:00",
         "first_run_days": 7,
         "include_remote": [],  # Add "remote" to include remote jobs
-        "attach_csv": True
+        "location_keywords": ["san francisco", "sf", "bay area"],  # Whole-word, case-insensitive
+        "job_filter": {},  # e.g. {"departments": ["Research"], "min_salary": 200000} - yearly, in reference_currency
+        "label": "San Francisco",  # Region name used in reports and email subjects
+        "profiles": {},  # Named profiles overriding the settings above, each with its own outputs
+        "api_url": "https://api.ashbyhq.com/posting-api/job-board/{board}?includeCompensation=true",
+        "attach_csv": True,
+        "notify_compensation_changes": True,  # Separate email when an existing posting's salary or equity changes
+        "strip_non_ascii": True,  # Drop non-ASCII characters left in compensation text after normalization
+        "fx_rates_file": "fx_rates.json",  # Local exchange-rate table used to compare salaries across currencies
+        "reference_currency": "USD",  # Currency annualized salaries are reported in
+        "stream_parse": False,  # Decode the API response incrementally, filtering jobs as they arrive
+        "boards": ["openai"],  # Ashby job boards to monitor
+        "max_concurrent_fetches": 8,
+        "connect_timeout": 5,
+        "read_timeout": 30,
+        "fetch_retries": 3,
+        "retry_backoff_base": 1.0,  # Seconds, doubled on each retry with full jitter
+        "retry_backoff_max": 30.0,
+        "fetch_deadline": 300,  # Total seconds allowed for fetching all boards in one run
+        "circuit_breaker_threshold": 3,  # Consecutive failed runs before a board is skipped
+        "circuit_breaker_cooldown_hours": 6,
+        "record_snapshots": False,  # Save compressed raw API responses under job_data/snapshots
+        "snapshot_keep": 30,
+        "database_backend": "json",  # "json", "sqlite" or "eventlog" - the last two write only what changed
+        "event_log_compact_bytes": 1048576,  # eventlog: fold the log into a new snapshot past this size...
+        "event_log_compact_days": 7,  # ...or once its oldest event is this old
+        "externalize_descriptions": True,  # Keep descriptions in job_data/descriptions, records hold their hashes
+        "archive_closed_jobs": True  # Move expired closed jobs to job_data/archive instead of deleting them
     }
     
     if Path(config_file).exists():
@@ -543,7 +2898,34 @@ def create_sample_config():
         "check_time": "09:00",
         "first_run_days": 7,
         "include_remote": [],
-        "attach_csv": True
+        "location_keywords": ["san francisco", "sf", "bay area"],
+        "job_filter": {},
+        "label": "San Francisco",
+        "profiles": {},
+        "api_url": "https://api.ashbyhq.com/posting-api/job-board/{board}?includeCompensation=true",
+        "attach_csv": True,
+        "notify_compensation_changes": True,
+        "strip_non_ascii": True,
+        "fx_rates_file": "fx_rates.json",
+        "reference_currency": "USD",
+        "stream_parse": False,
+        "boards": ["openai"],
+        "max_concurrent_fetches": 8,
+        "connect_timeout": 5,
+        "read_timeout": 30,
+        "fetch_retries": 3,
+        "retry_backoff_base": 1.0,
+        "retry_backoff_max": 30.0,
+        "fetch_deadline": 300,
+        "circuit_breaker_threshold": 3,
+        "circuit_breaker_cooldown_hours": 6,
+        "record_snapshots": False,
+        "snapshot_keep": 30,
+        "database_backend": "json",
+        "event_log_compact_bytes": 1048576,
+        "event_log_compact_days": 7,
+        "externalize_descriptions": True,
+        "archive_closed_jobs": True
     }
     
     with open("config_sample.json", 'w') as f:
@@ -557,14 +2939,60 @@ def main():
     parser.add_argument('--run-once', action='store_true', help='Run once and exit')
     parser.add_argument('--create-config', action='store_true', help='Create sample config file')
     parser.add_argument('--config', default='config.json', help='Config file path')
+    parser.add_argument('--replay', nargs='+', metavar='SNAPSHOT',
+                        help='Run checks against recorded snapshots, in order, instead of the live API')
+    parser.add_argument('--description-history', metavar='JOB',
+                        help='Show the description revisions recorded for a job (URL, id or unique part of the URL)')
+    parser.add_argument('--description-diff', nargs=3, metavar=('JOB', 'FROM', 'TO'),
+                        help='Show the diff between two numbered description revisions of a job')
+    parser.add_argument('--html', action='store_true',
+                        help='Use descriptionHtml instead of descriptionPlain for description history')
+    parser.add_argument('--archived', nargs='*', metavar='YYYY-MM',
+                        help='List archived closed jobs, optionally only those closed from/to the given months')
+    parser.add_argument('--migrate-sqlite', action='store_true',
+                        help='Copy the JSON job database into SQLite (set database_backend to "sqlite" to use it)')
     
     args = parser.parse_args()
+    if args.description_diff:
+        job_ref, from_revision, to_revision = args.description_diff
+        try:
+            args.description_diff = [job_ref, int(from_revision), int(to_revision)]
+        except ValueError:
+            parser.error('--description-diff: FROM and TO must be revision numbers')
     
     if args.create_config:
         create_sample_config()
         return
     
     config = load_config(args.config)
+    
+    if args.description_history or args.description_diff:
+        monitor = OpenAIJobMonitor(config)
+        field = 'descriptionHtml' if args.html else 'descriptionPlain'
+        if args.description_history:
+            monitor.show_description_history(args.description_history, field)
+        else:
+            job_ref, from_revision, to_revision = args.description_diff
+            monitor.show_description_diff(job_ref, from_revision, to_revision, field)
+        return
+    
+    if args.archived is not None:
+        months = args.archived + [None] * (2 - len(args.archived))
+        OpenAIJobMonitor(config).show_archived_jobs(months[0], months[1])
+        return
+    
+    if args.migrate_sqlite:
+        OpenAIJobMonitor(config).migrate_database()
+        return
+    
+    if args.replay:
+        # Replays are offline runs - never notify anyone about them
+        config['email_enabled'] = False
+        monitor = OpenAIJobMonitor(config)
+        for snapshot in args.replay:
+            monitor.replay(Path(snapshot))
+        return
+    
     monitor = OpenAIJobMonitor(config)
     
     if args.run_once:
@@ -0,0 +1,19 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# The monitor and the stand-in server are top-level scripts, not a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Check times shared by the store, index and record tests
+DAY_1 = datetime(2026, 3, 2, 9, 0)
+DAY_2 = DAY_1 + timedelta(days=1)
+DAY_3 = DAY_1 + timedelta(days=2)
+
+
+def make_job(number, **fields):
+    """A stored ACTIVE record first seen on DAY_1, with any fields overridden"""
+    job = {'id': f'id-{number}', 'jobUrl': f'https://jobs.example/{number}', 'title': f'Job {number}',
+           'location': 'San Francisco', 'status': 'ACTIVE', 'first_seen': DAY_1.isoformat()}
+    job.update(fields)
+    return job
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import DAY_1, DAY_2
+from openai_job_monitor import OpenAIJobMonitor, load_config
+
+
+def compensation(salary_min, salary_max, equity=None, equity_type='EquityPercentage'):
+    components = [{'compensationType': 'Salary', 'minValue': salary_min, 'maxValue': salary_max,
+                   'currencyCode': 'USD', 'interval': '1 YEAR'}]
+    if equity:
+        components.append({'compensationType': equity_type, 'minValue': equity[0], 'maxValue': equity[1]})
+    return {'compensationTierSummary': f"${salary_min} - ${salary_max}", 'summaryComponents': components}
+
+
+def fetched(number, **fields):
+    job = {'id': f'id-{number}', 'jobUrl': f'https://jobs.example/{number}', 'title': f'Job {number}',
+           'location': 'San Francisco', 'applyUrl': f'https://jobs.example/{number}/apply',
+           'publishedAt': '2026-03-01T00:00:00.000+00:00', 'isRemote': False}
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    config = load_config(tmp_path / 'config.json')
+    config.update(email_enabled=True, attach_csv=False)
+    monitor = OpenAIJobMonitor(config, tmp_path / 'job_data')
+    monitor.sent = []
+    monkeypatch.setattr(monitor, 'send_email', lambda subject, body, attach_csv=False: monitor.sent.append(body))
+    return monitor
+
+
+def test_compensation_changes_are_emailed_once(monitor):
+    monitor.process_jobs([fetched(1, compensation=compensation(200000, 300000))], DAY_1)
+    monitor.sent.clear()
+
+    monitor.process_jobs([fetched(1, compensation=compensation(210000, 300000)), fetched(2)], DAY_2)
+
+    new_jobs_email, compensation_email = monitor.sent
+    assert 'Job 2' in new_jobs_email
+    assert 'COMPENSATION CHANGES' not in new_jobs_email
+    assert '$200,000 - $300,000 -> $210,000 - $300,000' in compensation_email
+    assert 'COMPENSATION CHANGES' in monitor.report_file.read_text()
+
+
+@pytest.mark.parametrize('old, new, new_type, expected', [
+    (None, (0.1, 0.2), 'EquityPercentage', 'none -> 0.1% - 0.2%'),
+    ((0.1, 0.2), (0.1, 0.3), 'EquityPercentage', '0.1% - 0.2% -> 0.1% - 0.3%'),
+    ((0.1, 0.2), (10000, 20000), 'EquityCashValue', '0.1% - 0.2% -> Offered'),
+])
+def test_equity_changes_read_as_in_the_report(monitor, old, new, new_type, expected):
+    monitor.process_jobs([fetched(1, compensation=compensation(200000, 300000, old))], DAY_1)
+
+    monitor.process_jobs([fetched(1, compensation=compensation(200000, 300000, new, new_type))], DAY_2)
+
+    report = monitor.report_file.read_text()
+    assert f"Equity: {expected}" in report
+    assert 'None' not in report
@@ -0,0 +1,59 @@
+from openai_job_monitor import DescriptionStore
+
+HTML_V1 = "<p>Build the training stack.</p>\n<p>Work with researchers.</p>"
+HTML_V2 = "<p>Build the training stack.</p>\n<p>Work closely with researchers.</p>"
+PLAIN = "Build the training stack.\nWork with researchers."
+
+
+def test_edited_description_resolves_through_delta(tmp_path):
+    store = DescriptionStore(tmp_path)
+    old = store.put(HTML_V1)
+    new = store.put(HTML_V2)
+
+    store.record_revisions([('job-1', 'https://jobs/1', '2026-01-02T00:00:00',
+                             {'descriptionHtml': old}, {'descriptionHtml': new}, '2026-01-01T00:00:00')])
+
+    assert not store.blob_path(old).exists()
+    assert store.delta_path(old).exists()
+    assert DescriptionStore(tmp_path).get(old) == HTML_V1
+    assert DescriptionStore(tmp_path).get(new) == HTML_V2
+
+
+def test_unchanged_field_keeps_its_text_when_another_field_is_edited(tmp_path):
+    store = DescriptionStore(tmp_path)
+    old_html = store.put(HTML_V1)
+    new_html = store.put(HTML_V2)
+    plain = store.put(PLAIN)
+
+    store.record_revisions([('job-1', 'https://jobs/1', '2026-01-02T00:00:00',
+                             {'descriptionHtml': old_html, 'descriptionPlain': plain},
+                             {'descriptionHtml': new_html, 'descriptionPlain': plain},
+                             '2026-01-01T00:00:00')])
+
+    assert store.blob_path(plain).exists()
+    assert not store.delta_path(plain).exists()
+    assert DescriptionStore(tmp_path).get(plain) == PLAIN
+    assert DescriptionStore(tmp_path).get(old_html) == HTML_V1
+
+
+def test_store_as_delta_refuses_its_own_digest(tmp_path):
+    store = DescriptionStore(tmp_path)
+    digest = store.put(PLAIN)
+
+    store.store_as_delta(digest, digest)
+
+    assert store.blob_path(digest).exists()
+    assert DescriptionStore(tmp_path).get(digest) == PLAIN
+
+
+def test_text_that_returns_after_an_edit_is_stored_in_full(tmp_path):
+    store = DescriptionStore(tmp_path)
+    first = store.put(HTML_V1)
+    second = store.put(HTML_V2)
+    store.record_revisions([('job-1', 'https://jobs/1', '2026-01-02T00:00:00',
+                             {'descriptionHtml': first}, {'descriptionHtml': second}, '2026-01-01T00:00:00')])
+
+    assert store.put(HTML_V1) == first
+    assert store.blob_path(first).exists()
+    assert not store.delta_path(first).exists()
+    assert DescriptionStore(tmp_path).get(first) == HTML_V1
@@ -0,0 +1,217 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import openai_job_monitor
+from ashby_standin_server import AshbyStandinServer
+from openai_job_monitor import OpenAIJobMonitor, job_key, load_config
+
+JOBS_PER_BOARD = 40
+EVERY_LOCATION = ['san francisco', 'new york', 'seattle', 'washington', 'remote', 'london',
+                  'dublin', 'paris', 'tokyo', 'singapore']
+
+
+@pytest.fixture
+def server():
+    server = AshbyStandinServer(('127.0.0.1', 0), {'jobs': JOBS_PER_BOARD, 'description_size': 200, 'faults': {}})
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_monitor(server, tmp_path):
+    def make_monitor(**overrides):
+        config = load_config(tmp_path / 'config.json')
+        config.update({
+            'api_url': f"http://127.0.0.1:{server.server_address[1]}/posting-api/job-board/{{board}}",
+            'retry_backoff_base': 0.01,
+            'location_keywords': EVERY_LOCATION,
+        })
+        config.update(overrides)
+        return OpenAIJobMonitor(config, tmp_path / 'job_data')
+    return make_monitor
+
+
+def fetch(monitor, board_state=None, deadline_seconds=30):
+    return monitor.fetch_board('openai', board_state or {}, None, time.monotonic() + deadline_seconds)
+
+
+def test_server_errors_are_retried(server, make_monitor):
+    server.settings['faults']['openai'] = ['error', 'error']
+
+    result = fetch(make_monitor())
+
+    assert result['outcome'] == 'fetched'
+    assert len(result['jobs']) == JOBS_PER_BOARD
+    assert server.stats['requests'] == 3
+    assert 'consecutive_failures' not in result['fetch_state']
+
+
+def test_truncated_body_is_retried(server, make_monitor):
+    server.settings['faults']['openai'] = ['truncate']
+
+    result = fetch(make_monitor())
+
+    assert result['outcome'] == 'fetched'
+    assert len(result['jobs']) == JOBS_PER_BOARD
+    assert server.stats['truncated'] == 1
+
+
+def test_retry_after_sets_the_minimum_delay(server, make_monitor, monkeypatch):
+    server.settings.update(retry_after=7, faults={'openai': ['error']})
+    sleeps = []
+    monkeypatch.setattr(openai_job_monitor.time, 'sleep', sleeps.append)
+
+    result = fetch(make_monitor())
+
+    assert result['outcome'] == 'fetched'
+    assert sleeps == [7]
+
+
+def test_retry_after_past_the_deadline_gives_up(server, make_monitor, monkeypatch):
+    server.settings.update(retry_after=60, faults={'openai': ['error']})
+    sleeps = []
+    monkeypatch.setattr(openai_job_monitor.time, 'sleep', sleeps.append)
+
+    result = fetch(make_monitor(), deadline_seconds=5)
+
+    assert result['outcome'] == 'failed'
+    assert sleeps == []
+    assert server.stats['requests'] == 1
+
+
+def test_deadline_bounds_a_slow_board(server, make_monitor):
+    server.settings['latency'] = 2
+
+    started = time.monotonic()
+    result = fetch(make_monitor(), deadline_seconds=0.5)
+
+    assert result['outcome'] == 'failed'
+    assert time.monotonic() - started < 1.5
+    assert result['fetch_state']['consecutive_failures'] == 1
+
+
+def test_breaker_opens_after_consecutive_failed_runs(server, make_monitor):
+    server.settings['error_rate'] = 1.0
+    monitor = make_monitor(fetch_retries=0, circuit_breaker_threshold=2)
+
+    state = fetch(monitor)['fetch_state']
+    assert 'circuit_open_until' not in state
+    state = fetch(monitor, state)['fetch_state']
+    assert state['consecutive_failures'] == 2
+    assert datetime.fromisoformat(state['circuit_open_until']) > datetime.now()
+
+    requests_made = server.stats['requests']
+    assert fetch(monitor, state)['outcome'] == 'circuit_open'
+    assert server.stats['requests'] == requests_made
+
+
+def test_half_open_circuit_gets_one_probe(server, make_monitor):
+    server.settings['error_rate'] = 1.0
+    state = {'consecutive_failures': 3,
+             'circuit_open_until': (datetime.now() - timedelta(minutes=1)).isoformat()}
+
+    result = fetch(make_monitor(fetch_retries=3), state)
+
+    assert result['outcome'] == 'failed'
+    assert server.stats['requests'] == 1
+    assert result['fetch_state']['consecutive_failures'] == 4
+    assert datetime.fromisoformat(result['fetch_state']['circuit_open_until']) > datetime.now()
+
+
+def test_successful_probe_closes_the_circuit(server, make_monitor):
+    state = {'consecutive_failures': 3,
+             'circuit_open_until': (datetime.now() - timedelta(minutes=1)).isoformat()}
+
+    result = fetch(make_monitor(), state)
+
+    assert result['outcome'] == 'fetched'
+    assert not set(OpenAIJobMonitor.BREAKER_FIELDS) & set(result['fetch_state'])
+
+
+def test_failed_board_is_carried_forward(server, make_monitor):
+    make_monitor(boards=['openai', 'other'], fetch_retries=0).run_check()
+    first_run = {job_key(job): job for job in make_monitor().load_job_database()}
+    other_keys = {key for key, job in first_run.items() if job['board'] == 'other'}
+    assert other_keys
+
+    # The next day one board drops jobs while the other is down
+    server.settings['board_sizes'] = {'openai': JOBS_PER_BOARD - 10}
+    del server.payloads['openai']
+    server.settings['faults']['other'] = ['error']
+    monitor = make_monitor(boards=['openai', 'other'], fetch_retries=0)
+    monitor.run_check()
+
+    assert monitor.board_outcomes == {'openai': 'fetched', 'other': 'failed'}
+    assert monitor.fetch_outcome == 'partial'
+    database = {job_key(job): job for job in monitor.load_job_database()}
+    assert all(database[key]['status'] == 'ACTIVE' for key in other_keys)
+    assert any(job['status'] == 'CLOSED' for job in database.values() if job['board'] == 'openai')
+
+
+def active_jobs(monitor):
+    return [job for job in monitor.load_job_database() if job['status'] == 'ACTIVE']
+
+
+def test_live_run_after_a_replay_fetches_in_full(server, make_monitor):
+    recording = make_monitor(record_snapshots=True)
+    recording.run_check()
+    snapshot, = recording.snapshots_dir.iterdir()
+
+    server.settings['board_sizes'] = {'openai': JOBS_PER_BOARD - 10}
+    del server.payloads['openai']
+    make_monitor().run_check()
+    make_monitor().replay(snapshot)
+    assert len(active_jobs(make_monitor())) == JOBS_PER_BOARD
+
+    monitor = make_monitor()
+    monitor.run_check()
+
+    assert monitor.fetch_outcome == 'fetched'
+    assert len(active_jobs(monitor)) == JOBS_PER_BOARD - 10
+
+
+def test_not_modified_run_skips_database_and_dashboard_writes(server, make_monitor, monkeypatch):
+    make_monitor().run_check()
+
+    writes = []
+    for stage in ('update_job_database', 'generate_dashboard_data', 'save_current_jobs'):
+        monkeypatch.setattr(OpenAIJobMonitor, stage, lambda self, *args, stage=stage: writes.append(stage))
+    monitor = make_monitor()
+    monitor.run_check()
+
+    assert monitor.fetch_outcome == 'not_modified'
+    assert server.stats['not_modified'] == 1
+    assert writes == []
+
+
+def test_filter_change_ignores_stored_validators(server, make_monitor):
+    make_monitor().run_check()
+    everywhere = len(active_jobs(make_monitor()))
+
+    monitor = make_monitor(location_keywords=['san francisco'])
+    monitor.run_check()
+
+    assert monitor.fetch_outcome == 'fetched'
+    assert server.stats['not_modified'] == 0
+    assert 0 < len(active_jobs(monitor)) < everywhere
+
+
+def test_identical_body_is_not_processed_again(server, make_monitor, monkeypatch):
+    server.settings['validators'] = False
+    make_monitor().run_check()
+
+    writes = []
+    for stage in ('update_job_database', 'generate_dashboard_data', 'save_current_jobs'):
+        monkeypatch.setattr(OpenAIJobMonitor, stage, lambda self, *args, stage=stage: writes.append(stage))
+    monitor = make_monitor()
+    monitor.run_check()
+
+    assert monitor.fetch_outcome == 'same_content'
+    assert server.stats['not_modified'] == 0
+    assert writes == []
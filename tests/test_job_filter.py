@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from openai_job_monitor import JobFilter, SalaryNormalizer
+
+
+def salaried(amount, currency='USD', interval='1 YEAR'):
+    return {'title': 'Engineer', 'compensation': {'summaryComponents': [
+        {'compensationType': 'Salary', 'minValue': amount, 'maxValue': amount * 1.5,
+         'currencyCode': currency, 'interval': interval}]}}
+
+
+@pytest.fixture
+def salary_filter(tmp_path):
+    rates_file = tmp_path / 'fx_rates.json'
+    rates_file.write_text(json.dumps({'base': 'USD', 'rates': {'EUR': 1.25}}))
+    return JobFilter({'min_salary': 200000}, salary_normalizer=SalaryNormalizer(rates_file))
+
+
+@pytest.mark.parametrize('job, kept', [
+    (salaried(200000), True),
+    (salaried(190000), False),
+    (salaried(160000, 'EUR'), True),
+    (salaried(150000, 'EUR'), False),
+    (salaried(100, interval='1 HOUR'), True),
+    (salaried(90, interval='1 HOUR'), False),
+    (salaried(300000, 'GBP'), False),
+    ({'title': 'Engineer'}, False),
+])
+def test_min_salary_compares_yearly_reference_amounts(salary_filter, job, kept):
+    assert salary_filter(job) is kept
+
+
+def test_min_salary_without_a_normalizer_is_refused():
+    with pytest.raises(ValueError):
+        JobFilter({'min_salary': 200000})
@@ -0,0 +1,72 @@
+import random
+from datetime import timedelta
+
+from ashby_standin_server import JobGenerator
+from conftest import DAY_1
+from openai_job_monitor import JobRecord, parse_compensation, refresh_lifecycle_fields
+
+
+def api_jobs(count=20):
+    rng = random.Random(0)
+    generator = JobGenerator(description_size=100)
+    return [generator.generate_job(rng, 'openai') for _ in range(count)]
+
+
+def stored(job, **fields):
+    record = dict(job, status='ACTIVE', first_seen=DAY_1.isoformat(), last_seen=DAY_1.isoformat())
+    record.update(parse_compensation(job.get('compensation'))['fields'])
+    record.update(fields)
+    return record
+
+
+def test_stored_records_round_trip():
+    jobs = [stored(job) for job in api_jobs()]
+    jobs.append(stored(api_jobs(1)[0], status='CLOSED', closed_date=(DAY_1 + timedelta(days=2)).isoformat()))
+
+    for job in jobs:
+        assert JobRecord.from_dict(job).to_dict() == job
+
+
+def test_timestamps_that_would_not_format_back_are_kept_as_written():
+    job = stored(api_jobs(1)[0], publishedAt='2025-04-01T10:00:00Z', first_seen='2026-03-02 09:00:00')
+
+    record = JobRecord.from_dict(job)
+
+    assert record.timestamp('published_at').isoformat() == '2025-04-01T10:00:00+00:00'
+    assert record.timestamp('first_seen') == DAY_1
+    assert record.to_dict() == job
+
+
+def test_record_without_typed_compensation_fields_is_parsed_but_not_extended():
+    job = api_jobs(1)[0]
+    salary = next(component for component in job['compensation']['summaryComponents']
+                  if component['compensationType'] == 'Salary')
+
+    record = JobRecord.from_dict(job)
+
+    assert (record.salary_min, record.salary_max, record.currency) == (
+        salary['minValue'], salary['maxValue'], salary['currencyCode'])
+    assert record.to_dict() == job
+
+
+def test_department_and_team_names_are_interned():
+    # Built at run time, so each job holds its own copy until interned
+    first, second = (JobRecord.from_dict(stored(job, department=''.join(['Rese', 'arch']),
+                                                team=''.join(['Ali', 'gnment'])))
+                     for job in api_jobs(2))
+
+    assert first.department is second.department
+    assert first.team is second.team
+
+
+def test_lifecycle_fields_count_whole_days():
+    active = {'status': 'ACTIVE', 'first_seen': '2026-03-01T18:00:00'}
+    closed = {'status': 'CLOSED', 'first_seen': '2026-02-20T09:00:00', 'closed_date': '2026-02-28T10:00:00'}
+
+    refresh_lifecycle_fields(active, DAY_1)
+    refresh_lifecycle_fields(closed, DAY_1)
+
+    assert active['days_since_listed'] == 0
+    assert active['last_seen'] == DAY_1.isoformat()
+    assert closed['days_since_listed'] == 8
+    assert closed['days_until_deletion'] == 4
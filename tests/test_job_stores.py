@@ -0,0 +1,166 @@
+import gzip
+import json
+
+import pytest
+
+from conftest import DAY_1, DAY_2, DAY_3, make_job
+from openai_job_monitor import (CLOSED_RETENTION_DAYS, EventLogJobStore, JsonJobStore, OpenAIJobMonitor,
+                                SqliteJobStore, job_key)
+
+STORES = {
+    'json': lambda root: JsonJobStore(root / 'jobs.json'),
+    'sqlite': lambda root: SqliteJobStore(root / 'jobs.db'),
+    'eventlog': lambda root: EventLogJobStore(root / 'snapshot.json', root / 'events.jsonl', root / 'events'),
+}
+
+
+@pytest.fixture(params=sorted(STORES))
+def open_store(request, tmp_path):
+    # A fresh store object per call, as each run opens the database anew
+    return lambda: STORES[request.param](tmp_path)
+
+
+def event(event_type, job, at, **details):
+    return OpenAIJobMonitor.job_event(event_type, job, at, **details)
+
+
+def saved(store):
+    return {job_key(job): job for job in store.load()}
+
+
+def test_lifecycle_events_round_trip(open_store):
+    first, second = make_job(1), make_job(2)
+    open_store().save([event('OPENED', first, DAY_1, record=first),
+                       event('OPENED', second, DAY_1, record=second)], DAY_1)
+
+    open_store().save([event('UPDATED', first, DAY_2, fields={'title': 'Job 1, renamed'}),
+                       event('CLOSED', second, DAY_2, last_seen=DAY_1.isoformat())], DAY_2)
+
+    jobs = saved(open_store())
+    assert jobs['id-1']['title'] == 'Job 1, renamed'
+    assert jobs['id-1']['status'] == 'ACTIVE'
+    assert jobs['id-1']['last_seen'] == DAY_2.isoformat()
+    assert jobs['id-1']['days_since_listed'] == 1
+    assert jobs['id-2']['status'] == 'CLOSED'
+    assert jobs['id-2']['closed_date'] == DAY_2.isoformat()
+    assert jobs['id-2']['last_seen'] == DAY_1.isoformat()
+    assert jobs['id-2']['days_until_deletion'] == CLOSED_RETENTION_DAYS
+
+
+def test_updated_event_removes_fields(open_store):
+    job = make_job(1, team='Inference')
+    open_store().save([event('OPENED', job, DAY_1, record=job)], DAY_1)
+
+    open_store().save([event('UPDATED', job, DAY_2, fields={}, removed=['team'])], DAY_2)
+
+    assert 'team' not in saved(open_store())['id-1']
+
+
+def test_remapped_job_keeps_its_history(open_store):
+    job = make_job(1)
+    open_store().save([event('OPENED', job, DAY_1, record=job)], DAY_1)
+
+    moved = dict(job, id='id-1b')
+    open_store().save([event('REMAPPED', moved, DAY_2, previous_key='id-1')], DAY_2)
+
+    jobs = saved(open_store())
+    assert list(jobs) == ['id-1b']
+    assert jobs['id-1b']['first_seen'] == DAY_1.isoformat()
+    assert jobs['id-1b']['days_since_listed'] == 1
+
+
+def test_purged_job_is_removed(open_store):
+    first, second = make_job(1), make_job(2)
+    open_store().save([event('OPENED', first, DAY_1, record=first),
+                       event('OPENED', second, DAY_1, record=second)], DAY_1)
+
+    open_store().save([event('PURGED', first, DAY_2)], DAY_2)
+
+    assert list(saved(open_store())) == ['id-2']
+
+
+def test_get_returns_only_the_requested_keys(open_store):
+    jobs = [make_job(number) for number in range(5)]
+    open_store().save([event('OPENED', job, DAY_1, record=job) for job in jobs], DAY_1)
+
+    assert set(open_store().get(['id-1', 'id-3', 'id-missing'])) == {'id-1', 'id-3'}
+    assert open_store().get([]) == {}
+
+
+def test_clock_fields_follow_a_check_without_changes(open_store):
+    job = make_job(1)
+    open_store().save([event('OPENED', job, DAY_1, record=job)], DAY_1)
+
+    open_store().save([], DAY_3)
+
+    jobs = saved(open_store())
+    assert jobs['id-1']['last_seen'] == DAY_3.isoformat()
+    assert jobs['id-1']['days_since_listed'] == 2
+
+
+def test_sqlite_is_seeded_from_the_json_database(tmp_path):
+    jobs = [make_job(number, last_seen=DAY_2.isoformat()) for number in range(3)]
+    JsonJobStore(tmp_path / 'jobs.json').save([event('OPENED', job, DAY_1, record=job) for job in jobs], DAY_2)
+
+    store = SqliteJobStore(tmp_path / 'jobs.db', tmp_path / 'jobs.json')
+
+    assert saved(store) == saved(JsonJobStore(tmp_path / 'jobs.json'))
+    assert store.record_version() == 0
+
+
+def test_sqlite_revision_changes_with_every_save(tmp_path):
+    store = SqliteJobStore(tmp_path / 'jobs.db')
+    job = make_job(1)
+    store.save([event('OPENED', job, DAY_1, record=job)], DAY_1)
+    first_revision = store.revision()
+
+    store.save([], DAY_2)
+
+    assert first_revision
+    assert store.revision() != first_revision
+    assert SqliteJobStore(tmp_path / 'jobs.db').revision() == store.revision()
+
+
+def test_event_log_appends_changes_after_the_first_snapshot(tmp_path):
+    store = STORES['eventlog'](tmp_path)
+    job = make_job(1)
+    store.save([event('OPENED', job, DAY_1, record=job)], DAY_1)
+    assert store.snapshot_path.exists()
+    assert not store.log_path.exists()
+
+    store.save([event('UPDATED', job, DAY_2, fields={'title': 'Job 1, renamed'})], DAY_2)
+    store.save([], DAY_3)
+
+    assert [line['type'] for line in map(json.loads, store.log_path.read_text().splitlines())] == [
+        'UPDATED', 'CHECKED']
+    jobs = saved(store)
+    assert jobs['id-1']['title'] == 'Job 1, renamed'
+    assert jobs['id-1']['last_seen'] == DAY_3.isoformat()
+
+
+def test_event_log_skips_a_partly_written_last_line(tmp_path):
+    store = STORES['eventlog'](tmp_path)
+    first, second = make_job(1), make_job(2)
+    store.save([event('OPENED', first, DAY_1, record=first)], DAY_1)
+    store.save([event('OPENED', second, DAY_2, record=second)], DAY_2)
+
+    with open(store.log_path, 'a') as f:
+        f.write('{"type": "CLOSED", "at"')
+
+    assert set(saved(store)) == {'id-1', 'id-2'}
+
+
+def test_event_log_is_compacted_and_archived(tmp_path):
+    store = EventLogJobStore(tmp_path / 'snapshot.json', tmp_path / 'events.jsonl', tmp_path / 'events',
+                             compact_bytes=1)
+    first, second = make_job(1), make_job(2)
+    store.save([event('OPENED', first, DAY_1, record=first)], DAY_1)
+
+    store.save([event('OPENED', second, DAY_2, record=second)], DAY_2)
+
+    assert not store.log_path.exists()
+    archived = list((tmp_path / 'events').glob('*.jsonl.gz'))
+    assert len(archived) == 1
+    with gzip.open(archived[0], 'rt') as f:
+        assert json.loads(f.readline())['type'] == 'OPENED'
+    assert set(saved(store)) == {'id-1', 'id-2'}
@@ -0,0 +1,93 @@
+import pytest
+
+from conftest import DAY_1, DAY_2, make_job
+from openai_job_monitor import JobStateIndex, JsonJobStore, OpenAIJobMonitor, load_config
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobStateIndex(tmp_path / 'state.idx', 'sqlite')
+    index.rebuild([
+        make_job(1, last_seen=DAY_2.isoformat()),
+        make_job(2, jobUrl='https://jobs.example/städte'),
+        make_job(3, status='CLOSED', closed_date=DAY_2.isoformat()),
+    ])
+    return index
+
+
+def test_round_trip(index):
+    index.save('revision-1')
+
+    loaded = JobStateIndex(index.path, 'sqlite')
+    assert loaded.load('revision-1')
+    assert loaded.entries == index.entries
+    assert loaded.by_url == index.by_url
+    assert loaded.from_epoch(loaded.entries['id-3'][4]) == DAY_2
+    assert loaded.entries['id-2'][4] == 0
+
+
+@pytest.mark.parametrize('backend, revision', [('sqlite', 'revision-2'), ('json', 'revision-1')])
+def test_index_for_another_store_is_not_trusted(index, backend, revision):
+    index.save('revision-1')
+
+    assert not JobStateIndex(index.path, backend).load(revision)
+
+
+def test_index_with_bad_magic_is_not_trusted(index):
+    index.save('revision-1')
+    index.path.write_bytes(b'XXXXX' + index.path.read_bytes()[len(JobStateIndex.MAGIC):])
+
+    assert not JobStateIndex(index.path, 'sqlite').load('revision-1')
+
+
+def test_truncated_index_is_not_trusted(index):
+    index.save('revision-1')
+    index.path.write_bytes(index.path.read_bytes()[:-10])
+
+    loaded = JobStateIndex(index.path, 'sqlite')
+    assert not loaded.load('revision-1')
+    assert loaded.entries == {}
+
+
+def test_rekey_and_remove_keep_the_url_lookup_in_step(index):
+    index.rekey('id-1', 'id-1b', 'https://jobs.example/1b')
+    index.remove('id-2')
+
+    assert set(index.entries) == {'id-1b', 'id-3'}
+    assert index.by_url == {'https://jobs.example/1b': 'id-1b', 'https://jobs.example/3': 'id-3'}
+
+
+def sqlite_monitor(tmp_path):
+    config = load_config(tmp_path / 'config.json')
+    config['database_backend'] = 'sqlite'
+    return OpenAIJobMonitor(config, tmp_path / 'job_data')
+
+
+def fetched(number):
+    return {'id': f'id-{number}', 'jobUrl': f'https://jobs.example/{number}', 'title': f'Job {number}',
+            'location': 'San Francisco', 'publishedAt': '2026-03-01T00:00:00.000+00:00'}
+
+
+def test_unchanged_run_reads_no_records(tmp_path, monkeypatch):
+    sqlite_monitor(tmp_path).update_job_database([fetched(1), fetched(2)], DAY_1)
+
+    monitor = sqlite_monitor(tmp_path)
+    full_loads = []
+    monkeypatch.setattr(monitor.job_store, 'load', lambda: full_loads.append(1) or [])
+    assert monitor.update_job_database([fetched(1), fetched(2)], DAY_2) == []
+    assert full_loads == []
+
+
+def test_store_replaced_behind_the_index_is_diffed_in_full(tmp_path):
+    monitor = sqlite_monitor(tmp_path)
+    monitor.update_job_database([fetched(1), fetched(2)], DAY_1)
+
+    # Re-seed the SQLite database from a JSON database that only has the first job
+    monitor.job_store.path.unlink()
+    job = dict(fetched(1), status='ACTIVE', first_seen=DAY_1.isoformat())
+    JsonJobStore(monitor.master_database_file).save(
+        [OpenAIJobMonitor.job_event('OPENED', job, DAY_1, record=job)], DAY_1)
+
+    new_jobs = sqlite_monitor(tmp_path).update_job_database([fetched(1), fetched(2)], DAY_2)
+
+    assert [job['id'] for job in new_jobs] == ['id-2']
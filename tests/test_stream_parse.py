@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from ashby_standin_server import JobGenerator
+from openai_job_monitor import JsonArrayStream, OpenAIJobMonitor, load_config
+
+
+def chunked(data: bytes, size: int):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+def streamed(data: bytes, size: int = 1):
+    return list(JsonArrayStream(chunked(data, size), 'jobs'))
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7])
+def test_numbers_split_across_chunks(size):
+    numbers = [0, -3, 12345, 2.5, -0.125, 6.02e23, 1e-7, -4E+2]
+    data = json.dumps({'jobs': numbers, 'total': 8}).encode('utf-8')
+
+    assert streamed(data, size) == numbers
+
+
+@pytest.mark.parametrize('size', [1, 2, 3])
+def test_multibyte_text_split_across_chunks(size):
+    jobs = [{'title': 'Ingénieur', 'location': 'Zürich'}, {'title': '東京 エンジニア 🚀'}]
+    data = json.dumps({'jobs': jobs}, ensure_ascii=False).encode('utf-8')
+
+    assert streamed(data, size) == jobs
+
+
+@pytest.mark.parametrize('data', [b'{}', b'{"apiVersion": "1"}', b'{"jobs": []}', b' { "jobs" : [ ] } '])
+def test_empty_or_missing_jobs(data):
+    assert streamed(data) == []
+
+
+def test_members_around_the_array_are_skipped():
+    data = b'{"apiVersion": "1", "jobs": [{"id": 1}, {"id": 2}], "meta": {"jobs": [3]}}'
+
+    assert streamed(data, 4) == [{'id': 1}, {'id': 2}]
+
+
+@pytest.mark.parametrize('cut', [1, 10, 25, -2, -1])
+def test_truncated_stream_raises(cut):
+    data = json.dumps({'jobs': [{'id': 1, 'title': 'Job 1'}, {'id': 2, 'title': 'Job 2'}]}).encode('utf-8')
+
+    with pytest.raises(ValueError):
+        streamed(data[:cut], 3)
+
+
+@pytest.mark.parametrize('size', [1, 100, 65536])
+def test_stream_parse_matches_the_full_parse(tmp_path, size):
+    generator = JobGenerator(description_size=300)
+    content = json.dumps({'apiVersion': '1', 'jobs': generator.generate_board('openai', 50)},
+                         ensure_ascii=False).encode('utf-8')
+    monitor = OpenAIJobMonitor(load_config(tmp_path / 'config.json'), tmp_path / 'job_data')
+
+    parsed = monitor.parse_jobs(content, monitor.job_filter)
+    streamed_jobs = monitor.stream_jobs(iter(chunked(content, size)), monitor.job_filter)
+
+    assert parsed[0]
+    assert streamed_jobs == parsed